@@ -4,6 +4,9 @@
 DEFAULT_MAX_DEPTH = 3  # Inheritance/derived tree depth limit
 DEFAULT_MAX_NODES = 100  # Call graph node limit
 
+# Cached tool results kept per tool on each ProjectFacts (least recently used evicted)
+QUERY_CACHE_MAXSIZE = 128
+
 # Special Solidity function names (entry points/lifecycle)
 SPECIAL_FUNCTION_NAMES = frozenset(
     {
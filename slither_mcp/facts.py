@@ -172,16 +172,27 @@ def populate_contract_facts(contracts: list) -> dict[ContractKey, ContractModel]
     Returns:
         Dictionary mapping ContractKeys to ContractModels
     """
+    # Reuse one ContractKey per contract for every reference to it (keys, scopes,
+    # inheritance) so that key comparisons can short-circuit on identity
+    interned_keys: dict[tuple[str, str], ContractKey] = {}
+
+    def intern_key(slither_contract) -> ContractKey:
+        ident = (slither_contract.name, slither_contract.file_scope.filename.short)
+        key = interned_keys.get(ident)
+        if key is None:
+            key = interned_keys[ident] = get_contract_key(slither_contract)
+        return key
+
     ret = {}
     for contract in contracts:
-        contract_key = get_contract_key(contract)
+        contract_key = intern_key(contract)
         funcsDeclared = get_modeled_functions(contract.functions_and_modifiers_declared)
         funcsInherited = get_modeled_functions(contract.functions_and_modifiers_inherited)
 
         # Populate contract scopes
         contract_scopes = []
         for _, scope in contract.file_scope.contracts.items():
-            contract_scopes.append(get_contract_key(scope))
+            contract_scopes.append(intern_key(scope))
         # add self just in case
         contract_scopes.append(contract_key)
 
@@ -189,7 +200,7 @@ def populate_contract_facts(contracts: list) -> dict[ContractKey, ContractModel]
         state_vars = extract_state_variables(contract)
         events = extract_events(contract)
 
-        ret[get_contract_key(contract)] = ContractModel(
+        ret[contract_key] = ContractModel(
             name=contract.name,
             key=contract_key,
             path=contract.file_scope.filename.short,
@@ -197,8 +208,8 @@ def populate_contract_facts(contracts: list) -> dict[ContractKey, ContractModel]
             is_fully_implemented=contract.is_fully_implemented,
             is_interface=contract.is_interface,
             is_library=contract.is_library,
-            directly_inherits=[get_contract_key(c) for c in contract.immediate_inheritance],
-            scopes=contract_scopes,
+            directly_inherits=tuple(intern_key(c) for c in contract.immediate_inheritance),
+            scopes=tuple(contract_scopes),
             functions_declared=funcsDeclared,
             functions_inherited=funcsInherited,
             state_variables=state_vars,
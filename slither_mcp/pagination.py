@@ -1,5 +1,6 @@
 """Pagination utilities for MCP tool responses."""
 
+from collections.abc import Sequence
 from typing import TypeVar
 
 from pydantic import Field, field_validator
@@ -48,14 +49,17 @@ class PaginatedRequest(JSONStringTolerantModel):
 
 
 def apply_pagination(
-    items: list[T],
+    items: Sequence[T],
     offset: int,
     limit: int | None,
-) -> tuple[list[T], int, bool]:
-    """Apply pagination to a list of items.
+) -> tuple[Sequence[T], int, bool]:
+    """Apply pagination to a sequence of items.
+
+    The page is a slice of items, so it has the same type: a list for a list and
+    a tuple for a tuple.
 
     Args:
-        items: The full list of items to paginate
+        items: The full sequence of items to paginate
         offset: Number of items to skip from the beginning
         limit: Maximum number of items to return (None for no limit)
 
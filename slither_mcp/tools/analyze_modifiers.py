@@ -120,10 +120,9 @@ def analyze_modifiers(
         if "." in name:
             contract_name = name.split(".")[0]
             # Find contract with this name
-            for key in project_facts.contracts:
-                if key.contract_name == contract_name:
-                    defining_contract = key
-                    break
+            same_name = project_facts.contract_keys_by_name.get(contract_name)
+            if same_name:
+                defining_contract = same_name[0]
 
         modifiers.append(
             ModifierUsage(
@@ -173,8 +173,8 @@ def get_contract_dependencies(
                 # Resolve contract names to ContractKeys
                 for target_name in external_targets:
                     # Find the contract key for this name
-                    for other_key in project_facts.contracts:
-                        if other_key.contract_name == target_name and other_key != contract_key:
+                    for other_key in project_facts.contract_keys_by_name.get(target_name, ()):
+                        if other_key != contract_key:
                             # Avoid duplicate dependencies
                             existing = [
                                 d for d in depends_on[contract_key] if d.contract_key == other_key
@@ -192,8 +192,8 @@ def get_contract_dependencies(
                             break
 
                 for target_name in library_targets:
-                    for other_key in project_facts.contracts:
-                        if other_key.contract_name == target_name and other_key != contract_key:
+                    for other_key in project_facts.contract_keys_by_name.get(target_name, ()):
+                        if other_key != contract_key:
                             existing = [
                                 d for d in depends_on[contract_key] if d.contract_key == other_key
                             ]
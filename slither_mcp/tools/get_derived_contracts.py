@@ -93,13 +93,8 @@ def build_derived_tree(
     if contract_key in visited:
         return DerivedNode(contract_key=contract_key, derived_by=[])
 
-    visited.add(contract_key)
-
     # Find all contracts that directly inherit from this contract
-    direct_children = []
-    for potential_child_key, potential_child_model in project_facts.contracts.items():
-        if contract_key in potential_child_model.directly_inherits:
-            direct_children.append(potential_child_key)
+    direct_children = project_facts.derived_contracts_map.get(contract_key, ())
 
     # Check depth limit - if at max depth, don't recurse further
     if max_depth is not None and current_depth >= max_depth:
@@ -108,19 +103,24 @@ def build_derived_tree(
             truncated_flag[0] = True
         return DerivedNode(contract_key=contract_key, derived_by=[])
 
-    # Recursively build trees for all children
-    derived_contracts = []
-    for child_key in direct_children:
-        derived_contracts.append(
-            build_derived_tree(
-                child_key,
-                project_facts,
-                visited.copy(),
-                current_depth + 1,
-                max_depth,
-                truncated_flag,
+    # Recursively build trees for all children. `visited` only holds the contracts
+    # on the current path, so it is restored before returning.
+    visited.add(contract_key)
+    try:
+        derived_contracts = []
+        for child_key in direct_children:
+            derived_contracts.append(
+                build_derived_tree(
+                    child_key,
+                    project_facts,
+                    visited,
+                    current_depth + 1,
+                    max_depth,
+                    truncated_flag,
+                )
             )
-        )
+    finally:
+        visited.discard(contract_key)
 
     return DerivedNode(contract_key=contract_key, derived_by=derived_contracts)
 
@@ -1,6 +1,7 @@
 """Tool for getting the source code of a specific function."""
 
 import os
+from itertools import islice
 from typing import Annotated
 
 from pydantic import BaseModel, Field
@@ -85,11 +86,12 @@ def get_function_source(
 
     # Read the source code
     try:
+        # Only read up to the last line of the function; anything after it is unused
         with open(file_path, encoding="utf-8") as f:
-            lines = f.readlines()
+            lines = list(islice(f, line_end))
 
         # Extract the function source (line numbers are 1-indexed)
-        if line_start > len(lines) or line_end > len(lines):
+        if line_end > len(lines):
             return GetFunctionSourceResponse(
                 success=False,
                 error_message=f"Line range {line_start}-{line_end} exceeds file length ({len(lines)} lines)",
@@ -1,8 +1,9 @@
 """Tool for getting inherited contracts."""
 
+from dataclasses import dataclass
 from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from slither_mcp.constants import DEFAULT_MAX_DEPTH
 from slither_mcp.types import (
@@ -15,13 +16,17 @@ from slither_mcp.types import (
 class InheritanceNode(BaseModel):
     """A node in the inheritance hierarchy tree."""
 
+    # Finished subtrees are shared between parents and cached across requests,
+    # so nodes must not be modified after they are built
+    model_config = ConfigDict(frozen=True)
+
     contract_key: Annotated[
         ContractKey, Field(description="The contract key for this node in the hierarchy")
     ]
     inherits: Annotated[
-        list["InheritanceNode"],
+        tuple["InheritanceNode", ...],
         Field(description="The contracts that this contract directly inherits from"),
-    ] = []
+    ] = ()
 
 
 # Rebuild the model to resolve forward references
@@ -62,6 +67,20 @@ class GetInheritedContractsResponse(BaseModel):
     error_message: str | None = None
 
 
+@dataclass(slots=True)
+class _TreeFrame:
+    """A contract whose parents are still being expanded by build_inheritance_tree."""
+
+    contract_key: ContractKey
+    cache_key: tuple[ContractKey, int | None]
+    parent_keys: tuple[ContractKey, ...]
+    depth: int
+    # One slot per parent, filled in by index as each parent subtree is finished
+    inherits: list[InheritanceNode | None]
+    next_parent: int = 0
+    complete: bool = True
+
+
 def build_inheritance_tree(
     contract_key: ContractKey,
     project_facts: ProjectFacts,
@@ -69,10 +88,18 @@ def build_inheritance_tree(
     current_depth: int = 0,
     max_depth: int | None = None,
     truncated_flag: list[bool] | None = None,
+    completed: dict[tuple[ContractKey, int | None], InheritanceNode] | None = None,
 ) -> InheritanceNode:
     """
     Build a recursive inheritance tree for a contract.
 
+    The tree is built depth-first with an explicit stack rather than recursion,
+    so deep hierarchies cannot hit Python's recursion limit. Subtrees are
+    memoized in `completed`, so an ancestor shared by several parents (diamond
+    inheritance) is expanded once and the same node is reused. The current path
+    is only tracked in `visited` when the contract is in
+    ProjectFacts.cyclic_inheritance; otherwise the walk is known to terminate.
+
     Args:
         contract_key: The contract to build the tree for
         project_facts: The project facts containing contract data
@@ -80,6 +107,7 @@ def build_inheritance_tree(
         current_depth: Current depth in the tree (0-indexed)
         max_depth: Maximum depth to traverse (None for unlimited)
         truncated_flag: Mutable list to track if truncation occurred
+        completed: Cache of finished subtrees keyed by (contract, remaining depth)
 
     Returns:
         InheritanceNode representing the contract and its inheritance hierarchy
@@ -88,39 +116,85 @@ def build_inheritance_tree(
         visited = set()
     if truncated_flag is None:
         truncated_flag = [False]
-
-    # Prevent infinite recursion in case of circular dependencies
-    if contract_key in visited:
-        return InheritanceNode(contract_key=contract_key, inherits=[])
-
-    visited.add(contract_key)
-
-    contract_model = project_facts.contracts.get(contract_key)
-    if contract_model is None:
-        return InheritanceNode(contract_key=contract_key, inherits=[])
-
-    # Check depth limit - if at max depth, don't recurse further
-    if max_depth is not None and current_depth >= max_depth:
-        # If there are parents we're not showing, mark as truncated
-        if contract_model.directly_inherits:
+    if completed is None:
+        completed = {}
+
+    stack: list[_TreeFrame] = []
+    # Cycles are found once per ProjectFacts, so acyclic hierarchies skip the
+    # path bookkeeping. Ancestors of an acyclic contract are acyclic as well.
+    track_path = contract_key in project_facts.cyclic_inheritance
+    # Bound once here since resolve() runs for every node in the tree
+    get_contract = project_facts.contracts.get
+
+    def resolve(key: ContractKey, depth: int) -> tuple[InheritanceNode | None, bool]:
+        """Return a finished (node, is_complete) pair, or push a frame and return None."""
+        # Prevent infinite recursion in case of circular dependencies. The cut-off
+        # node depends on the path taken, so it must not be cached.
+        if key in visited:
+            return InheritanceNode(contract_key=key), False
+
+        # The shape of a subtree only depends on how many levels are left to expand
+        remaining_depth = None if max_depth is None else max_depth - depth
+        cache_key = (key, remaining_depth)
+        cached = completed.get(cache_key)
+        if cached is not None:
+            return cached, True
+
+        # Missing contracts and contracts without parents (interfaces, libraries,
+        # base contracts) are leaves and never need a stack frame
+        contract_model = get_contract(key)
+        if contract_model is None or not contract_model.directly_inherits:
+            node = InheritanceNode(contract_key=key)
+            completed[cache_key] = node
+            return node, True
+
+        # Check depth limit - if at max depth, don't expand further
+        if remaining_depth is not None and remaining_depth <= 0:
+            # This contract has parents we're not showing, so mark as truncated
             truncated_flag[0] = True
-        return InheritanceNode(contract_key=contract_key, inherits=[])
-
-    # Recursively build trees for all directly inherited contracts
-    inherited_nodes = []
-    for parent_key in contract_model.directly_inherits:
-        inherited_nodes.append(
-            build_inheritance_tree(
-                parent_key,
-                project_facts,
-                visited.copy(),
-                current_depth + 1,
-                max_depth,
-                truncated_flag,
-            )
-        )
-
-    return InheritanceNode(contract_key=contract_key, inherits=inherited_nodes)
+            node = InheritanceNode(contract_key=key)
+            completed[cache_key] = node
+            return node, True
+
+        # `visited` only holds the contracts on the current path
+        if track_path:
+            visited.add(key)
+        parent_keys = contract_model.directly_inherits
+        stack.append(_TreeFrame(key, cache_key, parent_keys, depth, [None] * len(parent_keys)))
+        return None, True
+
+    root, _ = resolve(contract_key, current_depth)
+    if root is not None:
+        return root
+
+    try:
+        while True:
+            frame = stack[-1]
+            if frame.next_parent < len(frame.parent_keys):
+                index = frame.next_parent
+                frame.next_parent += 1
+                node, complete = resolve(frame.parent_keys[index], frame.depth + 1)
+                if node is not None:
+                    frame.inherits[index] = node
+                    frame.complete = frame.complete and complete
+                continue
+
+            # All parents are built: finish this node and hand it to its child
+            stack.pop()
+            if track_path:
+                visited.discard(frame.contract_key)
+            node = InheritanceNode(contract_key=frame.contract_key, inherits=tuple(frame.inherits))
+            if frame.complete:
+                completed[frame.cache_key] = node
+            if not stack:
+                return node
+            child = stack[-1]
+            child.inherits[child.next_parent - 1] = node
+            child.complete = child.complete and frame.complete
+    finally:
+        # Leave a caller-supplied visited set as it was if building fails midway
+        for frame in stack:
+            visited.discard(frame.contract_key)
 
 
 def get_inherited_contracts(
@@ -150,18 +224,27 @@ def get_inherited_contracts(
             ),
         )
 
-    # Build the recursive inheritance tree with depth tracking
-    truncated_flag = [False]
-    inheritance_tree = build_inheritance_tree(
-        request.contract_key,
-        project_facts,
-        max_depth=request.max_depth,
-        truncated_flag=truncated_flag,
-    )
+    # Repeated requests for the same contract and depth reuse the finished tree. The
+    # contract and depth come from the client, so query_cache keeps only the most
+    # recently used trees
+    cache_key = ("get_inherited_contracts", request.contract_key, request.max_depth)
+    cached = project_facts.query_cache.get(cache_key)
+    if cached is None:
+        # Build the recursive inheritance tree with depth tracking
+        truncated_flag = [False]
+        inheritance_tree = build_inheritance_tree(
+            request.contract_key,
+            project_facts,
+            max_depth=request.max_depth,
+            truncated_flag=truncated_flag,
+        )
+        cached = (inheritance_tree, truncated_flag[0])
+        project_facts.query_cache[cache_key] = cached
 
+    inheritance_tree, truncated = cached
     return GetInheritedContractsResponse(
         success=True,
         contract_key=request.contract_key,
         full_inheritance=inheritance_tree,
-        truncated=truncated_flag[0],
+        truncated=truncated,
     )
@@ -1,15 +1,24 @@
 """Tool for getting an aggregate overview of a Solidity project."""
 
+import heapq
+from bisect import bisect_left
+from collections import Counter
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from slither_mcp.types import JSONStringTolerantModel, ProjectFacts
 
+# Largest line count of the small, medium and large complexity buckets; longer
+# functions are very_large
+COMPLEXITY_LINE_LIMITS = (10, 30, 100)
+
 
 class ContractCounts(BaseModel):
     """Contract counts by type."""
 
+    model_config = ConfigDict(frozen=True)
+
     total: Annotated[int, Field(description="Total number of contracts")]
     concrete: Annotated[
         int, Field(description="Non-abstract, non-interface, non-library contracts")
@@ -22,6 +31,8 @@ class ContractCounts(BaseModel):
 class FunctionCounts(BaseModel):
     """Function counts."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_declared: Annotated[
         int, Field(description="Total functions declared across all contracts")
     ]
@@ -33,6 +44,8 @@ class FunctionCounts(BaseModel):
 class VisibilityDistribution(BaseModel):
     """Function visibility distribution."""
 
+    model_config = ConfigDict(frozen=True)
+
     public: int = 0
     external: int = 0
     internal: int = 0
@@ -42,6 +55,8 @@ class VisibilityDistribution(BaseModel):
 class ComplexityDistribution(BaseModel):
     """Function complexity distribution by lines of code."""
 
+    model_config = ConfigDict(frozen=True)
+
     small: Annotated[int, Field(description="Functions with 1-10 lines")]
     medium: Annotated[int, Field(description="Functions with 11-30 lines")]
     large: Annotated[int, Field(description="Functions with 31-100 lines")]
@@ -51,6 +66,8 @@ class ComplexityDistribution(BaseModel):
 class DetectorFindingsByImpact(BaseModel):
     """Detector findings grouped by impact level."""
 
+    model_config = ConfigDict(frozen=True)
+
     high: int = 0
     medium: int = 0
     low: int = 0
@@ -60,6 +77,8 @@ class DetectorFindingsByImpact(BaseModel):
 class TopDetector(BaseModel):
     """A detector with high finding count."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     finding_count: int
     impact: str
@@ -68,13 +87,17 @@ class TopDetector(BaseModel):
 class ProjectOverview(BaseModel):
     """Aggregate statistics about a Solidity project."""
 
+    # The overview is cached per project and shared between responses, so it and
+    # its parts must not be modified after they are built
+    model_config = ConfigDict(frozen=True)
+
     contract_counts: ContractCounts
     function_counts: FunctionCounts
     visibility_distribution: VisibilityDistribution
     complexity_distribution: ComplexityDistribution
     detector_findings_by_impact: DetectorFindingsByImpact
     top_detectors: Annotated[
-        list[TopDetector], Field(description="Top 5 detectors by finding count")
+        tuple[TopDetector, ...], Field(description="Top 5 detectors by finding count")
     ]
 
 
@@ -92,6 +115,99 @@ class GetProjectOverviewResponse(BaseModel):
     error_message: str | None = None
 
 
+def _compute_overview(project_facts: ProjectFacts) -> ProjectOverview:
+    """Aggregate contract, function and detector statistics for a project."""
+    # Contract counts, function counts and visibility/complexity distribution,
+    # gathered in a single pass over the contracts
+    contract_types: Counter[str] = Counter()
+    visibility_counts: Counter[str] = Counter()
+    # small, medium, large, very_large
+    complexity_counts = [0] * (len(COMPLEXITY_LINE_LIMITS) + 1)
+    total_declared = 0
+    total_inherited = 0
+
+    for contract in project_facts.contracts.values():
+        if contract.is_library:
+            contract_types["library"] += 1
+        elif contract.is_interface:
+            contract_types["interface"] += 1
+        elif contract.is_abstract:
+            contract_types["abstract"] += 1
+        else:
+            contract_types["concrete"] += 1
+
+        total_declared += len(contract.functions_declared)
+        total_inherited += len(contract.functions_inherited)
+
+        # Process declared functions for visibility and complexity
+        for func in contract.functions_declared.values():
+            visibility_counts[func.visibility.lower()] += 1
+
+            # Complexity by lines of code
+            lines = func.line_end - func.line_start + 1
+            complexity_counts[bisect_left(COMPLEXITY_LINE_LIMITS, lines)] += 1
+
+    contract_counts = ContractCounts(
+        total=len(project_facts.contracts),
+        concrete=contract_types["concrete"],
+        abstract=contract_types["abstract"],
+        interface=contract_types["interface"],
+        library=contract_types["library"],
+    )
+    function_counts = FunctionCounts(
+        total_declared=total_declared,
+        total_inherited=total_inherited,
+    )
+    # Visibilities other than these four are not reported
+    visibility = VisibilityDistribution(
+        public=visibility_counts["public"],
+        external=visibility_counts["external"],
+        internal=visibility_counts["internal"],
+        private=visibility_counts["private"],
+    )
+    small, medium, large, very_large = complexity_counts
+    complexity = ComplexityDistribution(
+        small=small, medium=medium, large=large, very_large=very_large
+    )
+
+    # Detector findings by impact
+    impact_counts: Counter[str] = Counter()
+    detector_counts: dict[str, tuple[int, str]] = {}  # name -> (count, impact)
+
+    for detector_name, results in project_facts.detector_results.items():
+        if results:
+            detector_counts[detector_name] = (len(results), results[0].impact.lower())
+
+            for result in results:
+                impact_level = result.impact.lower()
+                # Anything that is not high, medium or low counts as informational
+                if impact_level not in ("high", "medium", "low"):
+                    impact_level = "informational"
+                impact_counts[impact_level] += 1
+
+    findings_by_impact = DetectorFindingsByImpact(
+        high=impact_counts["high"],
+        medium=impact_counts["medium"],
+        low=impact_counts["low"],
+        informational=impact_counts["informational"],
+    )
+
+    # Top 5 detectors by finding count (ties keep detector order, as a stable sort would)
+    top = heapq.nlargest(5, detector_counts.items(), key=lambda x: x[1][0])
+    top_detectors = tuple(
+        TopDetector(name=name, finding_count=count, impact=impact) for name, (count, impact) in top
+    )
+
+    return ProjectOverview(
+        contract_counts=contract_counts,
+        function_counts=function_counts,
+        visibility_distribution=visibility,
+        complexity_distribution=complexity,
+        detector_findings_by_impact=findings_by_impact,
+        top_detectors=top_detectors,
+    )
+
+
 def get_project_overview(
     request: GetProjectOverviewRequest, project_facts: ProjectFacts
 ) -> GetProjectOverviewResponse:
@@ -109,106 +225,12 @@ def get_project_overview(
         GetProjectOverviewResponse with overview statistics
     """
     try:
-        # Contract counts
-        total_contracts = len(project_facts.contracts)
-        concrete = 0
-        abstract = 0
-        interface = 0
-        library = 0
-
-        for contract in project_facts.contracts.values():
-            if contract.is_library:
-                library += 1
-            elif contract.is_interface:
-                interface += 1
-            elif contract.is_abstract:
-                abstract += 1
-            else:
-                concrete += 1
-
-        contract_counts = ContractCounts(
-            total=total_contracts,
-            concrete=concrete,
-            abstract=abstract,
-            interface=interface,
-            library=library,
-        )
-
-        # Function counts and visibility/complexity distribution
-        total_declared = 0
-        total_inherited = 0
-        visibility = VisibilityDistribution()
-        complexity = ComplexityDistribution(small=0, medium=0, large=0, very_large=0)
-
-        for contract in project_facts.contracts.values():
-            total_declared += len(contract.functions_declared)
-            total_inherited += len(contract.functions_inherited)
-
-            # Process declared functions for visibility and complexity
-            for func in contract.functions_declared.values():
-                # Visibility
-                vis = func.visibility.lower()
-                if vis == "public":
-                    visibility.public += 1
-                elif vis == "external":
-                    visibility.external += 1
-                elif vis == "internal":
-                    visibility.internal += 1
-                elif vis == "private":
-                    visibility.private += 1
-
-                # Complexity by lines of code
-                lines = func.line_end - func.line_start + 1
-                if lines <= 10:
-                    complexity.small += 1
-                elif lines <= 30:
-                    complexity.medium += 1
-                elif lines <= 100:
-                    complexity.large += 1
-                else:
-                    complexity.very_large += 1
-
-        function_counts = FunctionCounts(
-            total_declared=total_declared,
-            total_inherited=total_inherited,
-        )
-
-        # Detector findings by impact
-        findings_by_impact = DetectorFindingsByImpact()
-        detector_counts: dict[str, tuple[int, str]] = {}  # name -> (count, impact)
-
-        for detector_name, results in project_facts.detector_results.items():
-            count = len(results)
-            if count > 0:
-                impact = results[0].impact.lower() if results else "informational"
-                detector_counts[detector_name] = (count, impact)
-
-                for result in results:
-                    impact_level = result.impact.lower()
-                    if impact_level == "high":
-                        findings_by_impact.high += 1
-                    elif impact_level == "medium":
-                        findings_by_impact.medium += 1
-                    elif impact_level == "low":
-                        findings_by_impact.low += 1
-                    else:
-                        findings_by_impact.informational += 1
-
-        # Top 5 detectors by finding count
-        sorted_detectors = sorted(detector_counts.items(), key=lambda x: x[1][0], reverse=True)[:5]
-        top_detectors = [
-            TopDetector(name=name, finding_count=count, impact=impact)
-            for name, (count, impact) in sorted_detectors
-        ]
-
-        overview = ProjectOverview(
-            contract_counts=contract_counts,
-            function_counts=function_counts,
-            visibility_distribution=visibility,
-            complexity_distribution=complexity,
-            detector_findings_by_impact=findings_by_impact,
-            top_detectors=top_detectors,
-        )
+        # The overview only depends on the facts, so it is computed once per project
+        cache_key = ("get_project_overview",)
+        overview = project_facts.query_cache.get(cache_key)
+        if overview is None:
+            overview = _compute_overview(project_facts)
+            project_facts.query_cache[cache_key] = overview
 
         return GetProjectOverviewResponse(success=True, overview=overview)
 
@@ -1,11 +1,12 @@
 """Tool for extracting storage slot layouts from contracts."""
 
+from functools import lru_cache
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from slither_mcp.pagination import PaginatedRequest, apply_pagination
-from slither_mcp.types import ContractKey, ProjectFacts, StateVariableModel
+from slither_mcp.types import ContractKey, ContractModel, ProjectFacts, StateVariableModel
 
 
 # Solidity type sizes in bytes (common types)
@@ -118,6 +119,9 @@ SLOT_SIZE = 32  # Storage slots are 32 bytes
 class StorageSlotInfo(BaseModel):
     """Information about a storage slot assignment."""
 
+    # Slot assignments are cached per project and shared between responses
+    model_config = ConfigDict(frozen=True)
+
     variable_name: Annotated[str, Field(description="Name of the state variable")]
     slot: Annotated[int, Field(description="Storage slot number (0-indexed)")]
     offset: Annotated[int, Field(description="Byte offset within the slot (0-31)")]
@@ -153,6 +157,8 @@ class GetStorageLayoutResponse(BaseModel):
     error_message: str | None = None
 
 
+# Contracts declare few distinct types, so results are memoized by type string
+@lru_cache(maxsize=1024)
 def _get_type_size(type_str: str) -> int:
     """Get the storage size for a Solidity type.
 
@@ -166,6 +172,11 @@ def _get_type_size(type_str: str) -> int:
     # Clean up type string
     type_str = type_str.strip()
 
+    # Elementary types are the common case and never match the patterns below
+    size = TYPE_SIZES.get(type_str)
+    if size is not None:
+        return size
+
     # Handle contract types as addresses
     if type_str.startswith("contract "):
         return 20
@@ -206,14 +217,11 @@ def _get_type_size(type_str: str) -> int:
         # These always start a new slot and may span multiple slots
         return 32  # Approximation
 
-    # Check basic types
-    if type_str in TYPE_SIZES:
-        return TYPE_SIZES[type_str]
-
     # Default to full slot for unknown types
     return 32
 
 
+@lru_cache(maxsize=1024)
 def _requires_new_slot(type_str: str) -> bool:
     """Check if a type must start at a new slot (cannot be packed)."""
     type_str = type_str.strip()
@@ -249,21 +257,33 @@ def _collect_inherited_variables(
 
     Returns list of (variable, declaring_contract_name) tuples.
     """
-    contract = project_facts.contracts.get(contract_key)
+    contracts = project_facts.contracts
+    contract = contracts.get(contract_key)
     if not contract:
         return []
 
-    # Build inheritance chain (parents first, then self)
-    # Use directly_inherits to walk up the inheritance tree
     inherited_vars: list[tuple[StateVariableModel, str]] = []
 
+    # The inheritance chain (parents first, then self) is precomputed once per
+    # project unless the hierarchy is circular
+    linearized = project_facts.linearized_inheritance.get(contract_key)
+    if linearized is not None:
+        for ck in linearized:
+            c = contracts[ck]
+            for var in c.state_variables:
+                if not var.is_constant and not var.is_immutable:
+                    inherited_vars.append((var, c.name))
+        return inherited_vars
+
+    # Circular hierarchy: use directly_inherits to walk up the inheritance tree
+
     # Process parent contracts recursively (depth-first, leftmost first)
     def collect_from_parents(ck: ContractKey, visited: set[ContractKey]) -> None:
         if ck in visited:
             return
         visited.add(ck)
 
-        c = project_facts.contracts.get(ck)
+        c = contracts.get(ck)
         if not c:
             return
 
@@ -282,52 +302,19 @@ def _collect_inherited_variables(
     return inherited_vars
 
 
-def get_storage_layout(
-    request: GetStorageLayoutRequest, project_facts: ProjectFacts
-) -> GetStorageLayoutResponse:
-    """Get storage slot layout for a contract.
+def _compute_storage_layout(
+    contract: ContractModel, include_inherited: bool, project_facts: ProjectFacts
+) -> tuple[tuple[StorageSlotInfo, ...], int]:
+    """Assign storage slots to a contract's state variables.
 
-    Computes storage slot assignments for state variables, accounting for
-    Solidity's packing rules and inheritance order.
-
-    Args:
-        request: The storage layout request
-        project_facts: The project facts containing contract data
-
-    Returns:
-        GetStorageLayoutResponse with storage slot information
+    Returns a tuple of (slot assignments in declaration order, total slots used).
     """
-    contract = project_facts.contracts.get(request.contract_key)
-    if not contract:
-        return GetStorageLayoutResponse(
-            success=False,
-            contract_key=request.contract_key,
-            error_message=(
-                f"Contract not found: '{request.contract_key.contract_name}' "
-                f"at '{request.contract_key.path}'. "
-                f"Use search_contracts or list_contracts to find available contracts."
-            ),
-        )
-
-    # Interfaces have no storage
-    if contract.is_interface:
-        return GetStorageLayoutResponse(
-            success=True,
-            contract_key=request.contract_key,
-            storage_slots=[],
-            total_count=0,
-            total_slots_used=0,
-            has_more=False,
-        )
-
     # Collect variables in order (inherited first, then declared)
     variables: list[tuple[StateVariableModel, str, bool]] = []
 
-    if request.include_inherited:
+    if include_inherited:
         # Get inherited variables (includes declared variables due to recursive walk)
-        for var, declaring_contract in _collect_inherited_variables(
-            request.contract_key, project_facts
-        ):
+        for var, declaring_contract in _collect_inherited_variables(contract.key, project_facts):
             is_inherited = declaring_contract != contract.name
             variables.append((var, declaring_contract, is_inherited))
     else:
@@ -373,6 +360,57 @@ def get_storage_layout(
     # Calculate total slots used
     total_slots_used = current_slot + (1 if current_offset > 0 else 0)
 
+    return tuple(storage_slots), total_slots_used
+
+
+def get_storage_layout(
+    request: GetStorageLayoutRequest, project_facts: ProjectFacts
+) -> GetStorageLayoutResponse:
+    """Get storage slot layout for a contract.
+
+    Computes storage slot assignments for state variables, accounting for
+    Solidity's packing rules and inheritance order.
+
+    Args:
+        request: The storage layout request
+        project_facts: The project facts containing contract data
+
+    Returns:
+        GetStorageLayoutResponse with storage slot information
+    """
+    contract = project_facts.contracts.get(request.contract_key)
+    if not contract:
+        return GetStorageLayoutResponse(
+            success=False,
+            contract_key=request.contract_key,
+            error_message=(
+                f"Contract not found: '{request.contract_key.contract_name}' "
+                f"at '{request.contract_key.path}'. "
+                f"Use search_contracts or list_contracts to find available contracts."
+            ),
+        )
+
+    # Interfaces have no storage
+    if contract.is_interface:
+        return GetStorageLayoutResponse(
+            success=True,
+            contract_key=request.contract_key,
+            storage_slots=[],
+            total_count=0,
+            total_slots_used=0,
+            has_more=False,
+        )
+
+    # The layout is deterministic per contract, so it is computed once per project.
+    # The contract comes from the client, so query_cache keeps only the most
+    # recently used layouts
+    cache_key = ("get_storage_layout", request.contract_key, request.include_inherited)
+    layout = project_facts.query_cache.get(cache_key)
+    if layout is None:
+        layout = _compute_storage_layout(contract, request.include_inherited, project_facts)
+        project_facts.query_cache[cache_key] = layout
+    storage_slots, total_slots_used = layout
+
     # Apply pagination
     paginated_slots, total_count, has_more = apply_pagination(
         storage_slots, request.offset, request.limit
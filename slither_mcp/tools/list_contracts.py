@@ -1,8 +1,9 @@
 """Tool for listing contracts with optional filters."""
 
+from collections.abc import Iterable
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from slither_mcp.pagination import PaginatedRequest, apply_pagination
 from slither_mcp.types import (
@@ -15,6 +16,9 @@ from slither_mcp.types import (
 class ContractInfo(BaseModel):
     """Basic contract information."""
 
+    # Listings are cached per project and shared between responses
+    model_config = ConfigDict(frozen=True)
+
     key: ContractKey
     is_abstract: bool
     is_interface: bool
@@ -48,7 +52,7 @@ class ListContractsResponse(BaseModel):
     """Response containing list of contracts."""
 
     success: bool
-    contracts: list[ContractInfo]
+    contracts: tuple[ContractInfo, ...]
     total_count: int
     has_more: Annotated[
         bool, Field(description="True if there are more results beyond this page")
@@ -56,41 +60,26 @@ class ListContractsResponse(BaseModel):
     error_message: str | None = None
 
 
-def list_contracts(
+def _collect_contracts(
     request: ListContractsRequest, project_facts: ProjectFacts
-) -> ListContractsResponse:
-    """
-    List all contracts with optional filters.
-
-    Args:
-        request: The list contracts request with filters
-        project_facts: The project facts containing contract data
-
-    Returns:
-        ListContractsResponse with filtered contract list
-    """
+) -> tuple[ContractInfo, ...]:
+    """Filter and sort the project's contracts for a request, ignoring pagination."""
     contracts = []
 
-    for key, model in project_facts.contracts.items():
+    # "all" (or no filter) takes every contract; other filters read the kind index
+    keys: Iterable[ContractKey]
+    if request.filter_type in (None, "all"):
+        keys = project_facts.contracts.keys()
+    else:
+        keys = project_facts.contracts_by_kind[request.filter_type]
+
+    for key in keys:
         # Apply exclude_paths filter
         if request.exclude_paths:
             if path_matches_exclusion(key.path, request.exclude_paths):
                 continue
 
-        # Apply filter_type
-        if request.filter_type == "concrete":
-            if model.is_interface or model.is_library or model.is_abstract:
-                continue
-        elif request.filter_type == "interface":
-            if not model.is_interface:
-                continue
-        elif request.filter_type == "library":
-            if not model.is_library:
-                continue
-        elif request.filter_type == "abstract":
-            if not model.is_abstract:
-                continue
-        # "all" includes everything
+        model = project_facts.contracts[key]
 
         # Calculate function count
         func_count = len(model.functions_declared) + len(model.functions_inherited)
@@ -116,9 +105,38 @@ def list_contracts(
         elif request.sort_by == "function_count":
             contracts.sort(key=lambda c: c.function_count, reverse=reverse)
 
+    return tuple(contracts)
+
+
+def list_contracts(
+    request: ListContractsRequest, project_facts: ProjectFacts
+) -> ListContractsResponse:
+    """
+    List all contracts with optional filters.
+
+    Args:
+        request: The list contracts request with filters
+        project_facts: The project facts containing contract data
+
+    Returns:
+        ListContractsResponse with filtered contract list
+    """
+    # Pages of the same listing share one filtered and sorted result per project
+    cache_key = (
+        "list_contracts",
+        request.filter_type,
+        request.sort_by,
+        request.sort_order,
+        tuple(request.exclude_paths) if request.exclude_paths else None,
+    )
+    contracts = project_facts.query_cache.get(cache_key)
+    if contracts is None:
+        contracts = _collect_contracts(request, project_facts)
+        project_facts.query_cache[cache_key] = contracts
+
     # Apply pagination
-    contracts, total_count, has_more = apply_pagination(contracts, request.offset, request.limit)
+    page, total_count, has_more = apply_pagination(contracts, request.offset, request.limit)
 
     return ListContractsResponse(
-        success=True, contracts=contracts, total_count=total_count, has_more=has_more
+        success=True, contracts=tuple(page), total_count=total_count, has_more=has_more
     )
@@ -24,7 +24,7 @@ class ListDetectorsResponse(BaseModel):
     """Response containing list of available detectors."""
 
     success: bool
-    detectors: list[DetectorMetadata]
+    detectors: tuple[DetectorMetadata, ...]
     total_count: int
     has_more: Annotated[
         bool, Field(description="True if there are more results beyond this page")
@@ -50,11 +50,13 @@ def list_detectors(
 
         # Apply name filter if provided
         if request.name_filter:
-            filter_lower = request.name_filter.lower()
+            needle = request.name_filter.casefold()
             detectors = [
                 d
-                for d in detectors
-                if filter_lower in d.name.lower() or filter_lower in d.description.lower()
+                for d, (name, description) in zip(
+                    detectors, project_facts.detector_search_text, strict=True
+                )
+                if needle in name or needle in description
             ]
 
         # Apply pagination
@@ -63,9 +65,12 @@ def list_detectors(
         )
 
         return ListDetectorsResponse(
-            success=True, detectors=detectors, total_count=total_count, has_more=has_more
+            success=True,
+            detectors=tuple(detectors),
+            total_count=total_count,
+            has_more=has_more,
         )
     except Exception as e:
         return ListDetectorsResponse(
-            success=False, detectors=[], total_count=0, has_more=False, error_message=str(e)
+            success=False, detectors=(), total_count=0, has_more=False, error_message=str(e)
         )
@@ -1,5 +1,6 @@
 """Tool for listing function callers."""
 
+import sys
 from typing import Annotated
 
 from pydantic import BaseModel, Field
@@ -17,13 +18,16 @@ class FunctionCallers(BaseModel):
     """Grouped function callers by call type."""
 
     internal_callers: Annotated[
-        list[FunctionKey], Field(description="Functions that call the target as an internal call")
+        tuple[FunctionKey, ...],
+        Field(description="Functions that call the target as an internal call"),
     ]
     external_callers: Annotated[
-        list[FunctionKey], Field(description="Functions that call the target as an external call")
+        tuple[FunctionKey, ...],
+        Field(description="Functions that call the target as an external call"),
     ]
     library_callers: Annotated[
-        list[FunctionKey], Field(description="Functions that call the target as a library call")
+        tuple[FunctionKey, ...],
+        Field(description="Functions that call the target as a library call"),
     ]
 
 
@@ -56,7 +60,8 @@ def list_function_callers(
     List all functions that call the target function, grouped by call type.
 
     This tool finds all functions in the project that may call the target function
-    by checking each function's callees lists (internal, external, library).
+    by looking it up in ProjectFacts.callers_index, the reverse of every function's
+    callees lists (internal, external, library).
 
     Args:
         request: The function callers request containing the function key
@@ -78,46 +83,15 @@ def list_function_callers(
     # Construct the target function's external signature format
     # This is the format used in FunctionCallees lists (e.g., "ContractName.signature()")
     target_ext_sig = f"{request.function_key.contract_name}.{request.function_key.signature}"
-    # Create normalized version for flexible matching
-    normalized_target = normalize_signature(target_ext_sig)
-
-    # Use sets to avoid duplicates
-    internal_callers_set: set[FunctionKey] = set()
-    external_callers_set: set[FunctionKey] = set()
-    library_callers_set: set[FunctionKey] = set()
-
-    def _matches_target(callee: str) -> bool:
-        """Check if a callee matches the target using normalized comparison."""
-        if callee == target_ext_sig:
-            return True
-        return normalize_signature(callee) == normalized_target
-
-    # Loop through all contracts and their functions
-    for contract_key, contract_model in project_facts.contracts.items():
-        # Check both declared and inherited functions
-        all_functions = {**contract_model.functions_declared, **contract_model.functions_inherited}
-
-        for func_sig, func_model in all_functions.items():
-            # Create the FunctionKey for this potential caller
-            caller_key = FunctionKey(
-                signature=func_sig, contract_name=contract_key.contract_name, path=contract_key.path
-            )
-
-            # Check if target appears in this function's callees (with normalized matching)
-            if any(_matches_target(c) for c in func_model.callees.internal_callees):
-                internal_callers_set.add(caller_key)
-
-            if any(_matches_target(c) for c in func_model.callees.external_callees):
-                external_callers_set.add(caller_key)
-
-            if any(_matches_target(c) for c in func_model.callees.library_callees):
-                library_callers_set.add(caller_key)
-
-    # Convert sets to lists for response
+
+    # Callers are indexed by normalized signature for flexible matching
+    target_key = sys.intern(normalize_signature(target_ext_sig))
+    callers_by_type = project_facts.callers_index.get(target_key, {})
+
     callers = FunctionCallers(
-        internal_callers=list(internal_callers_set),
-        external_callers=list(external_callers_set),
-        library_callers=list(library_callers_set),
+        internal_callers=callers_by_type.get("internal", ()),
+        external_callers=callers_by_type.get("external", ()),
+        library_callers=callers_by_type.get("library", ()),
     )
 
     return FunctionCallersResponse(success=True, query_context=response_qc, callers=callers)
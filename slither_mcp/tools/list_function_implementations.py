@@ -46,7 +46,7 @@ class ListFunctionImplementationsResponse(BaseModel):
     """Response containing contracts that implement the function."""
 
     success: bool
-    implementations: list[ImplementationInfo] | None = None
+    implementations: tuple[ImplementationInfo, ...] | None = None
     total_count: int = 0
     has_more: Annotated[
         bool, Field(description="True if there are more results beyond this page")
@@ -2,11 +2,12 @@
 
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from slither_mcp.pagination import PaginatedRequest, apply_pagination
 from slither_mcp.types import (
     ContractKey,
+    ContractModel,
     FunctionKey,
     ProjectFacts,
     path_matches_exclusion,
@@ -16,9 +17,12 @@ from slither_mcp.types import (
 class FunctionInfo(BaseModel):
     """Basic function information."""
 
+    # Listings are cached per project and shared between responses
+    model_config = ConfigDict(frozen=True)
+
     function_key: FunctionKey
     visibility: str
-    solidity_modifiers: list[str]
+    solidity_modifiers: tuple[str, ...]
     is_declared: bool  # True if declared, False if inherited
     line_count: Annotated[int, Field(description="Number of lines in the function")] = 0
 
@@ -57,7 +61,7 @@ class ListFunctionsResponse(BaseModel):
     """Response containing list of functions."""
 
     success: bool
-    functions: list[FunctionInfo]
+    functions: tuple[FunctionInfo, ...]
     total_count: int
     has_more: Annotated[
         bool, Field(description="True if there are more results beyond this page")
@@ -65,43 +69,31 @@ class ListFunctionsResponse(BaseModel):
     error_message: str | None = None
 
 
-def list_functions(
+def _select_contracts(
     request: ListFunctionsRequest, project_facts: ProjectFacts
-) -> ListFunctionsResponse:
-    """
-    List functions with optional filters.
-
-    Args:
-        request: The list functions request with filters
-        project_facts: The project facts containing contract data
-
-    Returns:
-        ListFunctionsResponse with filtered function list
-    """
-    functions = []
-
-    # Determine which contracts to search
+) -> list[tuple[ContractKey, ContractModel]]:
+    """Pick the contracts a request searches; its contract_key must exist."""
     if request.contract_key:
         # Single contract mode
-        contract_model = project_facts.contracts.get(request.contract_key)
-        if not contract_model:
-            return ListFunctionsResponse(
-                success=False,
-                functions=[],
-                total_count=0,
-                error_message=f"Contract not found: {request.contract_key.contract_name}",
-            )
-        contracts_to_search = [(request.contract_key, contract_model)]
-    else:
-        # Project-wide mode
-        contracts_to_search = list(project_facts.contracts.items())
-        # Apply path exclusions for project-wide mode
-        if request.exclude_paths:
-            contracts_to_search = [
-                (key, model)
-                for key, model in contracts_to_search
-                if not path_matches_exclusion(key.path, request.exclude_paths)
-            ]
+        return [(request.contract_key, project_facts.contracts[request.contract_key])]
+
+    # Project-wide mode
+    contracts_to_search = list(project_facts.contracts.items())
+    # Apply path exclusions for project-wide mode
+    if request.exclude_paths:
+        contracts_to_search = [
+            (key, model)
+            for key, model in contracts_to_search
+            if not path_matches_exclusion(key.path, request.exclude_paths)
+        ]
+    return contracts_to_search
+
+
+def _collect_functions(
+    request: ListFunctionsRequest, contracts_to_search: list[tuple[ContractKey, ContractModel]]
+) -> tuple[FunctionInfo, ...]:
+    """Filter and sort the functions of the given contracts, ignoring pagination."""
+    functions = []
 
     # Iterate through contracts and functions
     for contract_key, contract_model in contracts_to_search:
@@ -176,9 +168,51 @@ def list_functions(
         elif request.sort_by == "line_count":
             functions.sort(key=lambda f: f.line_count, reverse=reverse)
 
+    return tuple(functions)
+
+
+def list_functions(
+    request: ListFunctionsRequest, project_facts: ProjectFacts
+) -> ListFunctionsResponse:
+    """
+    List functions with optional filters.
+
+    Args:
+        request: The list functions request with filters
+        project_facts: The project facts containing contract data
+
+    Returns:
+        ListFunctionsResponse with filtered function list
+    """
+    if request.contract_key and request.contract_key not in project_facts.contracts:
+        return ListFunctionsResponse(
+            success=False,
+            functions=(),
+            total_count=0,
+            error_message=f"Contract not found: {request.contract_key.contract_name}",
+        )
+
+    # Pages of the same listing share one filtered and sorted result per project,
+    # so a cached listing is returned without looking at the contracts again
+    cache_key = (
+        "list_functions",
+        request.contract_key,
+        tuple(request.visibility) if request.visibility else None,
+        tuple(request.has_modifiers) if request.has_modifiers else None,
+        tuple(request.exclude_paths)
+        if request.exclude_paths and request.contract_key is None
+        else None,
+        request.sort_by,
+        request.sort_order,
+    )
+    functions = project_facts.query_cache.get(cache_key)
+    if functions is None:
+        functions = _collect_functions(request, _select_contracts(request, project_facts))
+        project_facts.query_cache[cache_key] = functions
+
     # Apply pagination
-    functions, total_count, has_more = apply_pagination(functions, request.offset, request.limit)
+    page, total_count, has_more = apply_pagination(functions, request.offset, request.limit)
 
     return ListFunctionsResponse(
-        success=True, functions=functions, total_count=total_count, has_more=has_more
+        success=True, functions=page, total_count=total_count, has_more=has_more
     )
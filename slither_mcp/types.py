@@ -3,9 +3,15 @@
 import hashlib
 import json
 import os
-from typing import Annotated, Any, TypeAlias
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from functools import cache, cached_property
+from typing import Annotated, Any, Self, TypeAlias, TypeVar
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from slither_mcp.constants import QUERY_CACHE_MAXSIZE
 
 # Cache schema version - increment when ProjectFacts structure changes
 CACHE_SCHEMA_VERSION = "1.1.0"
@@ -148,6 +154,44 @@ class JSONStringTolerantModel(BaseModel):
         return data
 
 
+class CachedPropertyModel(BaseModel):
+    """
+    Base model for models that keep derived data in functools.cached_property.
+
+    Pydantic stores cached property values in the instance __dict__ next to the
+    fields, so a plain copy would carry them over and serve data derived from the
+    original fields. Copies made with copy.copy, copy.deepcopy or model_copy drop
+    every cached value and recompute it on first access instead.
+    """
+
+    def __copy__(self) -> Self:
+        return _drop_cached_properties(super().__copy__())
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        return _drop_cached_properties(super().__deepcopy__(memo))
+
+
+@cache
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    """Names of the cached properties defined on cls or its bases."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+_CachedModel = TypeVar("_CachedModel", bound=CachedPropertyModel)
+
+
+def _drop_cached_properties(model: _CachedModel) -> _CachedModel:
+    """Remove the cached property values from a freshly copied model."""
+    for name in _cached_property_names(type(model)):
+        model.__dict__.pop(name, None)
+    return model
+
+
 class FunctionCallees(BaseModel):
     internal_callees: Annotated[
         list[ExtFuncSig], Field(description="The internal functions called")
@@ -160,6 +204,17 @@ class FunctionCallees(BaseModel):
         bool, Field(description="Whether there are any low-level calls present")
     ]
 
+    @field_validator("internal_callees", "external_callees", "library_callees")
+    @classmethod
+    def intern_callees(cls, callees: list[ExtFuncSig]) -> list[ExtFuncSig]:
+        """
+        Intern callee signatures.
+
+        The same callee appears in many functions' lists, so interning keeps one
+        copy of each string and lets dict lookups on them match by identity.
+        """
+        return [sys.intern(callee) for callee in callees]
+
 
 class StateVariableModel(BaseModel):
     """Model for a state variable in a contract."""
@@ -237,6 +292,10 @@ class ContractKey(BaseModel):
         return hash((self.contract_name, self.path))
 
     def __eq__(self, other):
+        # Keys are shared between contracts when facts are generated, so identity
+        # is the common case for dict and set lookups
+        if self is other:
+            return True
         if not isinstance(other, ContractKey):
             return False
         return self.contract_name == other.contract_name and self.path == other.path
@@ -333,7 +392,7 @@ class FunctionModel(BaseModel):
     callees: Annotated[FunctionCallees, Field(description="The functions called by this function")]
 
 
-class ContractModel(BaseModel):
+class ContractModel(CachedPropertyModel):
     name: Annotated[contractName, Field(description="The name of the contract")]
     key: ContractKey
     path: Annotated[str, Field(description="The full path to the file the contract is located in")]
@@ -344,11 +403,11 @@ class ContractModel(BaseModel):
     is_interface: Annotated[bool, Field(description="Whether the contract is an interface")]
     is_library: Annotated[bool, Field(description="Whether the contract is a library")]
     directly_inherits: Annotated[
-        list[ContractKey],
+        tuple[ContractKey, ...],
         Field(description="The contracts that this one directly inherits from"),
     ]
     scopes: Annotated[
-        list["ContractKey"],
+        tuple["ContractKey", ...],
         Field(description="The contracts in scope for this contract"),
     ]
 
@@ -382,15 +441,7 @@ class ContractModel(BaseModel):
             return True
 
         # Try normalized matching (slow path)
-        normalized_sig = normalize_signature(sig)
-        for declared_sig in self.functions_declared:
-            if normalize_signature(declared_sig) == normalized_sig:
-                return True
-        for inherited_sig in self.functions_inherited:
-            if normalize_signature(inherited_sig) == normalized_sig:
-                return True
-
-        return False
+        return normalize_signature(sig) in self.normalized_signatures
 
     def find_function_signature(self, sig: FuncSig) -> str | None:
         """Find the actual stored signature matching the given signature.
@@ -406,16 +457,26 @@ class ContractModel(BaseModel):
         if sig in self.functions_inherited:
             return sig
 
-        # Try normalized matching (slow path)
-        normalized_sig = normalize_signature(sig)
-        for declared_sig in self.functions_declared:
-            if normalize_signature(declared_sig) == normalized_sig:
-                return declared_sig
-        for inherited_sig in self.functions_inherited:
-            if normalize_signature(inherited_sig) == normalized_sig:
-                return inherited_sig
+        # Fall back to normalized matching
+        return self.normalized_signatures.get(normalize_signature(sig))
+
+    @cached_property
+    def normalized_signatures(self) -> dict[str, str]:
+        """
+        Map normalized function signatures to the signatures stored on this contract.
 
-        return None
+        Built once so that does_contract_contain_function and find_function_signature
+        do not normalize every function on each lookup. When several functions
+        normalize alike, declared functions win over inherited ones and earlier
+        entries over later ones.
+
+        Returns:
+            Dict of normalized signature to the actual signature key
+        """
+        normalized: dict[str, str] = {}
+        for actual_sig in (*self.functions_declared, *self.functions_inherited):
+            normalized.setdefault(normalize_signature(actual_sig), actual_sig)
+        return normalized
 
     def is_contract_in_context(self, contract_name: str) -> bool:
         for scope in self.scopes:
@@ -444,7 +505,49 @@ class ContractModel(BaseModel):
         return list(inherited_contracts)
 
 
-class ProjectFacts(BaseModel):
+class QueryCache(MutableMapping[tuple[Any, ...], Any]):
+    """
+    Bounded cache of read-only tool results, keyed by (tool name, *arguments).
+
+    Request arguments come from clients, so each tool gets its own
+    least-recently-used store of at most maxsize entries. A client that keeps
+    varying its filters evicts that tool's oldest results instead of growing
+    memory without limit, and cannot push out the results of other tools.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._by_tool: dict[Any, OrderedDict[tuple[Any, ...], Any]] = {}
+
+    def __getitem__(self, key: tuple[Any, ...]) -> Any:
+        entries = self._by_tool.get(key[0])
+        if entries is None or key not in entries:
+            raise KeyError(key)
+        entries.move_to_end(key)
+        return entries[key]
+
+    def __setitem__(self, key: tuple[Any, ...], value: Any) -> None:
+        entries = self._by_tool.setdefault(key[0], OrderedDict())
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def __delitem__(self, key: tuple[Any, ...]) -> None:
+        entries = self._by_tool.get(key[0])
+        if entries is None or key not in entries:
+            raise KeyError(key)
+        del entries[key]
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        for entries in self._by_tool.values():
+            yield from entries
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_tool.values())
+
+
+class ProjectFacts(CachedPropertyModel):
     contracts: dict[ContractKey, ContractModel]
     project_dir: str
     detector_results: Annotated[
@@ -484,6 +587,207 @@ class ProjectFacts(BaseModel):
                 data["contracts"] = new_contracts
         return data
 
+    @cached_property
+    def derived_contracts_map(self) -> dict[ContractKey, tuple[ContractKey, ...]]:
+        """
+        Map each contract to the contracts that directly inherit from it.
+
+        This is the reverse of ContractModel.directly_inherits. It is built on first
+        access and shared by every later query, since ProjectFacts is not modified
+        once it has been generated.
+
+        Returns:
+            Dict of parent key to its direct children, in contract order. Contracts
+            that nothing inherits from are absent.
+        """
+        derived: dict[ContractKey, list[ContractKey]] = {}
+        for child_key, child_model in self.contracts.items():
+            # dict.fromkeys drops duplicate parents while keeping their order
+            for parent_key in dict.fromkeys(child_model.directly_inherits):
+                derived.setdefault(parent_key, []).append(child_key)
+        return {parent_key: tuple(children) for parent_key, children in derived.items()}
+
+    @cached_property
+    def contract_keys_by_name(self) -> dict[str, tuple[ContractKey, ...]]:
+        """
+        Index contract keys by contract name.
+
+        Lookups by name and path go straight to `contracts`; this serves places
+        that only know a contract's name, such as the "Contract." prefix of an
+        external signature. Several files may declare contracts with the same name.
+
+        Returns:
+            Dict of contract name to its keys, in contract order
+        """
+        by_name: dict[str, list[ContractKey]] = {}
+        for key in self.contracts:
+            by_name.setdefault(key.contract_name, []).append(key)
+        return {name: tuple(keys) for name, keys in by_name.items()}
+
+    @cached_property
+    def contracts_by_kind(self) -> dict[str, tuple[ContractKey, ...]]:
+        """
+        Index contracts by the kinds that list_contracts can filter on.
+
+        A contract can fall under more than one of "interface", "library" and
+        "abstract"; "concrete" holds the contracts that are none of those.
+
+        Returns:
+            Dict of kind to the matching contract keys, in contract order
+        """
+        kinds: dict[str, list[ContractKey]] = {
+            "concrete": [],
+            "interface": [],
+            "library": [],
+            "abstract": [],
+        }
+        for key, model in self.contracts.items():
+            if model.is_interface:
+                kinds["interface"].append(key)
+            if model.is_library:
+                kinds["library"].append(key)
+            if model.is_abstract:
+                kinds["abstract"].append(key)
+            if not (model.is_interface or model.is_library or model.is_abstract):
+                kinds["concrete"].append(key)
+        return {kind: tuple(keys) for kind, keys in kinds.items()}
+
+    @cached_property
+    def detector_search_text(self) -> tuple[tuple[str, str], ...]:
+        """
+        Casefolded name and description of each available detector.
+
+        list_detectors matches its name_filter against these instead of lowering
+        every detector's strings on each call.
+
+        Returns:
+            (name, description) pairs, aligned with available_detectors
+        """
+        return tuple(
+            (d.name.casefold(), d.description.casefold()) for d in self.available_detectors
+        )
+
+    @cached_property
+    def callers_index(self) -> dict[str, dict[str, tuple[FunctionKey, ...]]]:
+        """
+        Map each called function to the functions that call it, by call type.
+
+        This is the reverse of every FunctionModel.callees list, built once so that
+        list_function_callers is a lookup instead of a scan of every function.
+        Callees are keyed by their normalized external signature
+        ("Contract.function(args)"), so qualified and unqualified parameter types
+        meet on the same entry.
+
+        Returns:
+            Dict of normalized callee signature to a dict of call type ("internal",
+            "external" or "library") to its callers, without duplicates and in
+            contract order. Call types with no callers are absent.
+        """
+        # Each callee's callers are tagged with the call type in one insertion-ordered
+        # dict, which also drops duplicates, and split by call type at the end
+        tagged: dict[str, dict[tuple[str, FunctionKey], None]] = {}
+        normalized: dict[str, str] = {}
+        for contract_key, contract_model in self.contracts.items():
+            # Inherited entries replace declared ones with the same signature
+            all_functions = {
+                **contract_model.functions_declared,
+                **contract_model.functions_inherited,
+            }
+            for func_sig, func_model in all_functions.items():
+                caller_key = FunctionKey(
+                    signature=func_sig,
+                    contract_name=contract_key.contract_name,
+                    path=contract_key.path,
+                )
+                callees = func_model.callees
+                for call_type, callee_sigs in (
+                    ("internal", callees.internal_callees),
+                    ("external", callees.external_callees),
+                    ("library", callees.library_callees),
+                ):
+                    for callee in callee_sigs:
+                        # The same callee is called from many functions; normalize it once
+                        callee_key = normalized.get(callee)
+                        if callee_key is None:
+                            callee_key = sys.intern(normalize_signature(callee))
+                            normalized[callee] = callee_key
+                        tagged.setdefault(callee_key, {})[(call_type, caller_key)] = None
+
+        index: dict[str, dict[str, tuple[FunctionKey, ...]]] = {}
+        for callee_key, callers in tagged.items():
+            by_type: dict[str, list[FunctionKey]] = {}
+            for call_type, caller_key in callers:
+                by_type.setdefault(call_type, []).append(caller_key)
+            index[callee_key] = {call_type: tuple(keys) for call_type, keys in by_type.items()}
+        return index
+
+    @cached_property
+    def query_cache(self) -> QueryCache:
+        """
+        Results of read-only tool queries against these facts.
+
+        Tools store deterministic results here keyed by a tuple that starts with the
+        tool name, so repeated requests reuse them. Each tool keeps at most
+        QUERY_CACHE_MAXSIZE results and evicts the least recently used. The cache
+        lives on the instance: reloading a project creates a new ProjectFacts and
+        starts empty, and it is never serialized.
+
+        Returns:
+            QueryCache of (tool name, *arguments) to the cached result
+        """
+        return QueryCache(QUERY_CACHE_MAXSIZE)
+
+    @cached_property
+    def linearized_inheritance(self) -> dict[ContractKey, tuple[ContractKey, ...]]:
+        """
+        Order each contract's ancestors the way storage is laid out.
+
+        Parents come before children and the leftmost parent's chain comes first;
+        the contract itself is last and every contract appears once. Parents that
+        are missing from the facts are left out. This is computed once, in
+        topological order with Kahn's algorithm, so each contract reuses the
+        orders of its parents instead of walking the graph again.
+
+        Returns:
+            Dict of contract key to its ordered ancestors (ending with itself).
+            Contracts in ProjectFacts.cyclic_inheritance are absent.
+        """
+        pending = {
+            key: len({parent for parent in model.directly_inherits if parent in self.contracts})
+            for key, model in self.contracts.items()
+        }
+        ready = [key for key, count in pending.items() if count == 0]
+        linearized: dict[ContractKey, tuple[ContractKey, ...]] = {}
+        while ready:
+            key = ready.pop()
+            order: dict[ContractKey, None] = {}
+            for parent_key in self.contracts[key].directly_inherits:
+                # Contracts already reached through an earlier parent keep their position
+                order.update(dict.fromkeys(linearized.get(parent_key, ())))
+            order[key] = None
+            linearized[key] = tuple(order)
+
+            for child_key in self.derived_contracts_map.get(key, ()):
+                pending[child_key] -= 1
+                if pending[child_key] == 0:
+                    ready.append(child_key)
+        return linearized
+
+    @cached_property
+    def cyclic_inheritance(self) -> frozenset[ContractKey]:
+        """
+        Find contracts whose inheritance chain runs into a cycle.
+
+        Valid Solidity never has circular inheritance, so this is normally empty.
+        These are the contracts that Kahn's algorithm in linearized_inheritance
+        could not order: each is either on a cycle or inherits from one. Parents
+        missing from the facts count as leaves.
+
+        Returns:
+            Contracts for which walking up the inheritance graph can loop forever
+        """
+        return frozenset(self.contracts.keys() - self.linearized_inheritance.keys())
+
     def is_contract_in_context(self, context: ContractKey, contract_name: str) -> bool:
         context_contract = self.contracts.get(context)
         if not context_contract:
@@ -515,24 +819,24 @@ class ProjectFacts(BaseModel):
         ) -> list["ContractModel"]:
             children_with_implementation = []
 
-            for _, model in self.contracts.items():
-                if parent_contract.key in model.directly_inherits:
-                    # Check both declared and inherited functions
-                    has_implementation = model.functions_declared.get(
-                        f
-                    ) or model.functions_inherited.get(f)
-                    if has_implementation:
-                        children_with_implementation.append(model)
-
-                        # check for even deeper inherited contracts that override the implementation
-                        children_with_implementation.extend(
-                            get_contracts_implementing_function(model, f)
-                        )
-                    else:
-                        # function not implemented here, so it's implemented in a derived contract
-                        children_with_implementation.extend(
-                            get_contracts_implementing_function(model, f)
-                        )
+            for child_key in self.derived_contracts_map.get(parent_contract.key, ()):
+                model = self.contracts[child_key]
+                # Check both declared and inherited functions
+                has_implementation = model.functions_declared.get(
+                    f
+                ) or model.functions_inherited.get(f)
+                if has_implementation:
+                    children_with_implementation.append(model)
+
+                    # check for even deeper inherited contracts that override the implementation
+                    children_with_implementation.extend(
+                        get_contracts_implementing_function(model, f)
+                    )
+                else:
+                    # function not implemented here, so it's implemented in a derived contract
+                    children_with_implementation.extend(
+                        get_contracts_implementing_function(model, f)
+                    )
             return children_with_implementation
 
         return get_contracts_implementing_function(contract_model, signature)
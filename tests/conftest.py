@@ -17,55 +17,55 @@ from slither_mcp.types import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_path():
     """Default test project path for use in tool requests."""
     return "/test/project"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_contract_key():
     """ContractKey for BaseContract."""
     return ContractKey(contract_name="BaseContract", path="contracts/Base.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def interface_a_key():
     """ContractKey for InterfaceA."""
     return ContractKey(contract_name="InterfaceA", path="contracts/IInterface.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def library_b_key():
     """ContractKey for LibraryB."""
     return ContractKey(contract_name="LibraryB", path="contracts/Library.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def child_contract_key():
     """ContractKey for ChildContract."""
     return ContractKey(contract_name="ChildContract", path="contracts/Child.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def grandchild_contract_key():
     """ContractKey for GrandchildContract."""
     return ContractKey(contract_name="GrandchildContract", path="contracts/Grandchild.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_inherit_contract_key():
     """ContractKey for MultiInheritContract."""
     return ContractKey(contract_name="MultiInheritContract", path="contracts/Multi.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standalone_contract_key():
     """ContractKey for StandaloneContract."""
     return ContractKey(contract_name="StandaloneContract", path="contracts/Standalone.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_callees():
     """Empty FunctionCallees for test functions."""
     return FunctionCallees(
@@ -76,7 +76,7 @@ def empty_callees():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_contract(base_contract_key, empty_callees):
     """Mock BaseContract - abstract base contract."""
     return ContractModel(
@@ -148,7 +148,7 @@ def base_contract(base_contract_key, empty_callees):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def interface_a(interface_a_key, empty_callees):
     """Mock InterfaceA - interface contract."""
     return ContractModel(
@@ -180,7 +180,7 @@ def interface_a(interface_a_key, empty_callees):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def library_b(library_b_key, empty_callees):
     """Mock LibraryB - library contract."""
     return ContractModel(
@@ -212,7 +212,7 @@ def library_b(library_b_key, empty_callees):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def child_contract(child_contract_key, base_contract_key, base_contract, empty_callees):
     """Mock ChildContract - concrete contract inheriting from BaseContract."""
     # FunctionCallees with low-level call for testing
@@ -296,7 +296,7 @@ def child_contract(child_contract_key, base_contract_key, base_contract, empty_c
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def grandchild_contract(
     grandchild_contract_key,
     child_contract_key,
@@ -339,7 +339,7 @@ def grandchild_contract(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_inherit_contract(
     multi_inherit_contract_key,
     base_contract_key,
@@ -394,7 +394,7 @@ def multi_inherit_contract(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standalone_contract(standalone_contract_key, empty_callees):
     """Mock StandaloneContract - contract with no inheritance."""
     return ContractModel(
@@ -426,13 +426,13 @@ def standalone_contract(standalone_contract_key, empty_callees):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_contract_key():
     """ContractKey for EmptyContract."""
     return ContractKey(contract_name="EmptyContract", path="contracts/Empty.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_contract(empty_contract_key):
     """Mock EmptyContract - contract with no functions."""
     return ContractModel(
@@ -450,7 +450,7 @@ def empty_contract(empty_contract_key):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_facts(
     base_contract,
     interface_a,
@@ -469,7 +469,11 @@ def project_facts(
     standalone_contract_key,
     empty_contract_key,
 ):
-    """Complete ProjectFacts with all mock contracts."""
+    """Complete ProjectFacts with all mock contracts.
+
+    Session-scoped and shared by every test module; treat it as read-only and
+    build a fresh ProjectFacts for any test that needs different data.
+    """
     return ProjectFacts(
         contracts={
             base_contract_key: base_contract,
@@ -485,13 +489,173 @@ def project_facts(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_project_facts():
     """Empty ProjectFacts for edge case testing."""
     return ProjectFacts(contracts={}, project_dir="/test/empty")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def abstract_only_project_facts(project_facts):
+    """ProjectFacts holding only the abstract contracts of project_facts."""
+    return ProjectFacts(
+        contracts={k: v for k, v in project_facts.contracts.items() if v.is_abstract},
+        project_dir="/test/abstract_only",
+    )
+
+
+# Fixtures for malformed inheritance graphs
+
+
+@pytest.fixture(scope="session")
+def circular_a_key():
+    """ContractKey for ContractA in the circular inheritance project."""
+    return ContractKey(contract_name="ContractA", path="contracts/A.sol")
+
+
+@pytest.fixture(scope="session")
+def circular_b_key():
+    """ContractKey for ContractB in the circular inheritance project."""
+    return ContractKey(contract_name="ContractB", path="contracts/B.sol")
+
+
+@pytest.fixture(scope="session")
+def circular_project_facts(circular_a_key, circular_b_key):
+    """ProjectFacts where ContractA and ContractB inherit from each other."""
+    return ProjectFacts(
+        contracts={
+            circular_a_key: ContractModel(
+                name="ContractA",
+                key=circular_a_key,
+                path="contracts/A.sol",
+                is_abstract=False,
+                is_fully_implemented=True,
+                is_interface=False,
+                is_library=False,
+                directly_inherits=[circular_b_key],
+                scopes=[circular_a_key, circular_b_key],
+                functions_declared={},
+                functions_inherited={},
+                state_variables=[
+                    StateVariableModel(
+                        name="paused",
+                        type_str="bool",
+                        visibility="internal",
+                        is_constant=False,
+                        is_immutable=False,
+                        line_number=4,
+                    ),
+                    StateVariableModel(
+                        name="balance",
+                        type_str="uint256",
+                        visibility="internal",
+                        is_constant=False,
+                        is_immutable=False,
+                        line_number=5,
+                    ),
+                ],
+            ),
+            circular_b_key: ContractModel(
+                name="ContractB",
+                key=circular_b_key,
+                path="contracts/B.sol",
+                is_abstract=False,
+                is_fully_implemented=True,
+                is_interface=False,
+                is_library=False,
+                directly_inherits=[circular_a_key],  # Circular!
+                scopes=[circular_b_key, circular_a_key],
+                functions_declared={},
+                functions_inherited={},
+                state_variables=[
+                    StateVariableModel(
+                        name="total",
+                        type_str="uint256",
+                        visibility="internal",
+                        is_constant=False,
+                        is_immutable=False,
+                        line_number=4,
+                    ),
+                    StateVariableModel(
+                        name="owner",
+                        type_str="address",
+                        visibility="internal",
+                        is_constant=False,
+                        is_immutable=False,
+                        line_number=5,
+                    ),
+                ],
+            ),
+        },
+        project_dir="/test/circular",
+    )
+
+
+@pytest.fixture(scope="session")
+def self_ref_key():
+    """ContractKey for SelfRef, a contract that lists itself as a parent."""
+    return ContractKey(contract_name="SelfRef", path="contracts/SelfRef.sol")
+
+
+@pytest.fixture(scope="session")
+def self_ref_project_facts(self_ref_key):
+    """ProjectFacts with a contract that inherits from itself (never valid Solidity)."""
+    return ProjectFacts(
+        contracts={
+            self_ref_key: ContractModel(
+                name="SelfRef",
+                key=self_ref_key,
+                path="contracts/SelfRef.sol",
+                is_abstract=False,
+                is_fully_implemented=True,
+                is_interface=False,
+                is_library=False,
+                directly_inherits=[self_ref_key],  # Self-reference
+                scopes=[self_ref_key],
+                functions_declared={},
+                functions_inherited={},
+            ),
+        },
+        project_dir="/test/self_ref",
+    )
+
+
+@pytest.fixture(scope="session")
+def orphan_key():
+    """ContractKey for Orphan, a contract whose parent is missing from the facts."""
+    return ContractKey(contract_name="Orphan", path="contracts/Orphan.sol")
+
+
+@pytest.fixture(scope="session")
+def missing_parent_key():
+    """ContractKey for a parent contract that is not present in the facts."""
+    return ContractKey(contract_name="MissingParent", path="contracts/Missing.sol")
+
+
+@pytest.fixture(scope="session")
+def orphan_project_facts(orphan_key, missing_parent_key):
+    """ProjectFacts with a contract that inherits from a non-existent parent."""
+    return ProjectFacts(
+        contracts={
+            orphan_key: ContractModel(
+                name="Orphan",
+                key=orphan_key,
+                path="contracts/Orphan.sol",
+                is_abstract=False,
+                is_fully_implemented=True,
+                is_interface=False,
+                is_library=False,
+                directly_inherits=[missing_parent_key],
+                scopes=[orphan_key, missing_parent_key],
+                functions_declared={},
+                functions_inherited={},
+            ),
+        },
+        project_dir="/test/orphan",
+    )
+
+
+@pytest.fixture(scope="session")
 def detector_metadata_list():
     """List of mock detector metadata."""
     return [
@@ -522,7 +686,7 @@ def detector_metadata_list():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def detector_results_dict():
     """Dictionary of mock detector results."""
     return {
@@ -575,7 +739,7 @@ def detector_results_dict():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_facts_with_detectors(
     base_contract,
     child_contract,
@@ -599,19 +763,19 @@ def project_facts_with_detectors(
 # Fixtures for testing exclude_paths feature
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lib_contract_key():
     """ContractKey for a contract in lib/ directory."""
     return ContractKey(contract_name="LibDependency", path="lib/dependency/src/Dependency.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_contract_key():
     """ContractKey for a contract in test/ directory."""
     return ContractKey(contract_name="TestHelper", path="test/helpers/TestHelper.sol")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lib_contract(lib_contract_key, empty_callees):
     """Mock contract in lib/ directory."""
     return ContractModel(
@@ -643,7 +807,7 @@ def lib_contract(lib_contract_key, empty_callees):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_helper_contract(test_contract_key, empty_callees):
     """Mock contract in test/ directory."""
     return ContractModel(
@@ -675,7 +839,7 @@ def test_helper_contract(test_contract_key, empty_callees):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_facts_with_lib_and_test(
     project_facts,
     lib_contract,
@@ -695,7 +859,7 @@ def project_facts_with_lib_and_test(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def detector_results_with_test_findings():
     """Detector results that include findings in test and lib directories."""
     return {
@@ -740,7 +904,7 @@ def detector_results_with_test_findings():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_facts_with_detector_findings_in_test(
     project_facts_with_lib_and_test,
     detector_results_with_test_findings,
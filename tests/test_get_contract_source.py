@@ -7,7 +7,7 @@ from slither_mcp.tools.get_contract_source import (
     GetContractSourceRequest,
     get_contract_source,
 )
-from slither_mcp.types import ContractKey
+from slither_mcp.types import ContractKey, ContractModel, ProjectFacts
 
 
 class TestGetContractSourceHappyPath:
@@ -305,8 +305,6 @@ class TestGetContractSourceFilePathHandling:
         absolute_path = "/absolute/path/to/contracts/Base.sol"
 
         # Create a new contract model with absolute path
-        from slither_mcp.types import ContractModel
-
         modified_contract = ContractModel(
             name=contract.name,
             key=contract.key,
@@ -321,13 +319,16 @@ class TestGetContractSourceFilePathHandling:
             functions_inherited=contract.functions_inherited,
         )
 
-        # Replace in project_facts
-        project_facts.contracts[base_contract_key] = modified_contract
+        # Replace in a copy so the shared project_facts fixture stays untouched
+        modified_facts = ProjectFacts(
+            contracts={**project_facts.contracts, base_contract_key: modified_contract},
+            project_dir=project_facts.project_dir,
+        )
 
         request = GetContractSourceRequest(path=test_path, contract_key=base_contract_key)
 
         with patch("os.path.exists", return_value=True):
-            response = get_contract_source(request, project_facts)
+            response = get_contract_source(request, modified_facts)
 
         # Absolute paths should be rejected as path traversal
         assert response.success is False
@@ -339,8 +340,6 @@ class TestGetContractSourceFilePathHandling:
         contract = project_facts.contracts[base_contract_key]
         traversal_path = "../../../etc/passwd"
 
-        from slither_mcp.types import ContractModel
-
         modified_contract = ContractModel(
             name=contract.name,
             key=contract.key,
@@ -355,12 +354,15 @@ class TestGetContractSourceFilePathHandling:
             functions_inherited=contract.functions_inherited,
         )
 
-        project_facts.contracts[base_contract_key] = modified_contract
+        modified_facts = ProjectFacts(
+            contracts={**project_facts.contracts, base_contract_key: modified_contract},
+            project_dir=project_facts.project_dir,
+        )
 
         request = GetContractSourceRequest(path=test_path, contract_key=base_contract_key)
 
         with patch("os.path.exists", return_value=True):
-            response = get_contract_source(request, project_facts)
+            response = get_contract_source(request, modified_facts)
 
         # Path traversal should be rejected
         assert response.success is False
@@ -158,88 +158,22 @@ class TestGetDerivedContractsErrorCases:
 class TestGetDerivedContractsEdgeCases:
     """Test edge cases for get_derived_contracts."""
 
-    def test_circular_dependency_prevention(self, test_path, project_facts):
+    def test_circular_dependency_prevention(
+        self, test_path, circular_project_facts, circular_a_key
+    ):
         """Test that circular dependencies are handled gracefully."""
-        from slither_mcp.types import ContractModel, ProjectFacts
-
-        # Create two contracts that inherit from each other (circular)
-        contract_a_key = ContractKey(contract_name="ContractA", path="contracts/A.sol")
-        contract_b_key = ContractKey(contract_name="ContractB", path="contracts/B.sol")
-
-        # ContractA inherits from ContractB
-        contract_a = ContractModel(
-            name="ContractA",
-            key=contract_a_key,
-            path="contracts/A.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[contract_b_key],
-            scopes=[contract_a_key, contract_b_key],
-            functions_declared={},
-            functions_inherited={},
-        )
-
-        # ContractB inherits from ContractA (circular!)
-        contract_b = ContractModel(
-            name="ContractB",
-            key=contract_b_key,
-            path="contracts/B.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[contract_a_key],
-            scopes=[contract_b_key, contract_a_key],
-            functions_declared={},
-            functions_inherited={},
-        )
-
-        circular_project = ProjectFacts(
-            contracts={
-                contract_a_key: contract_a,
-                contract_b_key: contract_b,
-            },
-            project_dir="/test/circular",
-        )
-
         # Should handle circular dependency without infinite recursion
-        request = GetDerivedContractsRequest(path=test_path, contract_key=contract_a_key)
-        response = get_derived_contracts(request, circular_project)
+        request = GetDerivedContractsRequest(path=test_path, contract_key=circular_a_key)
+        response = get_derived_contracts(request, circular_project_facts)
 
         assert response.success is True
         assert response.full_derived is not None
         # The tree should be built but not recurse infinitely
 
-    def test_self_referencing_contract(self, test_path, project_facts):
+    def test_self_referencing_contract(self, test_path, self_ref_project_facts, self_ref_key):
         """Test contract that lists itself in inheritance (edge case)."""
-        from slither_mcp.types import ContractModel, ProjectFacts
-
-        self_ref_key = ContractKey(contract_name="SelfRef", path="contracts/SelfRef.sol")
-
-        # Contract that inherits from itself (should never happen in real code)
-        self_ref_contract = ContractModel(
-            name="SelfRef",
-            key=self_ref_key,
-            path="contracts/SelfRef.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[self_ref_key],  # Self-reference
-            scopes=[self_ref_key],
-            functions_declared={},
-            functions_inherited={},
-        )
-
-        self_ref_project = ProjectFacts(
-            contracts={self_ref_key: self_ref_contract},
-            project_dir="/test/self_ref",
-        )
-
         request = GetDerivedContractsRequest(path=test_path, contract_key=self_ref_key)
-        response = get_derived_contracts(request, self_ref_project)
+        response = get_derived_contracts(request, self_ref_project_facts)
 
         assert response.success is True
         # Should handle self-reference without infinite recursion
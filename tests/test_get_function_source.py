@@ -1,6 +1,9 @@
 """Tests for get_function_source tool."""
 
-from unittest.mock import mock_open, patch
+import io
+from unittest.mock import patch
+
+import pytest
 
 from slither_mcp.tools.get_function_source import (
     GetFunctionSourceRequest,
@@ -9,12 +12,12 @@ from slither_mcp.tools.get_function_source import (
 from slither_mcp.types import FunctionKey
 
 
-class TestGetFunctionSourceHappyPath:
-    """Test happy path scenarios for get_function_source."""
+def _fake_open(data: str):
+    """Patch builtins.open to return an in-memory file containing data."""
+    return patch("builtins.open", lambda *args, **kwargs: io.StringIO(data))
 
-    def test_get_declared_function_source(self, test_path, project_facts, base_contract_key):
-        """Test getting source code for a declared function."""
-        mock_source = """// SPDX-License-Identifier: MIT
+
+BASE_SOL = """// SPDX-License-Identifier: MIT
 pragma solidity ^0.8.0;
 
 abstract contract BaseContract {
@@ -29,67 +32,94 @@ abstract contract BaseContract {
         emit Initialized(data);
     }
 
+
     function baseFunction() internal view returns (uint256) {
         return data;
     }
 }
 """
-        function_key = FunctionKey(
-            signature="initialize()", contract_name="BaseContract", path="contracts/Base.sol"
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
 
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
+INTERFACE_SOL = """// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
 
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/Base.sol"
-        assert response.line_start == 10
-        assert response.line_end == 15
-        # Lines 10-15 should be extracted (1-indexed)
-        expected_code = """    function initialize() public {
-        // initialization logic
-        data = 42;
-        emit Initialized(data);
+interface InterfaceA {
+    function interfaceMethod() external;
+}
+"""
+
+LIBRARY_SOL = """// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+library LibraryB {
+    uint256 constant MAX = type(uint256).max;
+
+    function add(uint256 a, uint256 b) internal pure returns (uint256) {
+        require(a <= MAX - b, "Overflow");
+        return a + b;
+    }
+}
+"""
+
+CHILD_SOL = """// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import "./Base.sol";
+
+contract ChildContract is BaseContract {
+    address public owner;
+
+    modifier onlyOwner() {
+        require(msg.sender == owner, "Not owner");
+        _;
+    }
+    function childFunction(address _addr) public payable onlyOwner {
+        require(_addr != address(0), "Invalid");
+        owner = _addr;
+        // additional logic
+        emit OwnerChanged(_addr);
     }
 
+    event OwnerChanged(address indexed newOwner);
+}
 """
-        assert response.source_code == expected_code
 
-    def test_get_single_line_function_source(self, test_path, project_facts, interface_a_key):
-        """Test getting source code for a single-line function declaration."""
-        mock_source = """// SPDX-License-Identifier: MIT
+GRANDCHILD_SOL = """// SPDX-License-Identifier: MIT
 pragma solidity ^0.8.0;
 
-interface InterfaceA {
-    function interfaceMethod() external;
+import "./Child.sol";
+
+contract GrandchildContract is ChildContract {
+    uint256 public level;
+
+    constructor() {
+        level = 3;
+    }
+    function grandchildFunction() external view returns (bool) {
+        return level > 0;
+    }
 }
 """
-        function_key = FunctionKey(
-            signature="interfaceMethod()",
-            contract_name="InterfaceA",
-            path="contracts/IInterface.sol",
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
 
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
+MULTI_SOL = """// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
 
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/IInterface.sol"
-        assert response.line_start == 5
-        assert response.line_end == 5
-        assert response.source_code == "    function interfaceMethod() external;\n"
+import "./Base.sol";
+import "./IInterface.sol";
 
-    def test_get_multi_line_function_with_params(
-        self, test_path, project_facts, standalone_contract_key
-    ):
-        """Test getting source code for a multi-line function with parameters."""
-        mock_source = """// SPDX-License-Identifier: MIT
+contract MultiInheritContract is BaseContract, InterfaceA {
+    function interfaceMethod() external override {
+        // Implementation
+        emit MethodCalled();
+    }
+
+    function multiFunction() private {
+        // Private function
+        uint256 x = 42;
+    }
+}
+"""
+
+STANDALONE_SOL = """// SPDX-License-Identifier: MIT
 pragma solidity ^0.8.0;
 
 contract StandaloneContract {
@@ -115,24 +145,50 @@ contract StandaloneContract {
     bool private locked;
 }
 """
-        function_key = FunctionKey(
+
+# (mock_source, function_key, expected_path, line_start, line_end, expected_code)
+HAPPY_CASES = [
+    pytest.param(
+        BASE_SOL,
+        FunctionKey(
+            signature="initialize()", contract_name="BaseContract", path="contracts/Base.sol"
+        ),
+        "contracts/Base.sol",
+        10,
+        15,
+        """    function initialize() public {
+        // initialization logic
+        data = 42;
+        emit Initialized(data);
+    }
+
+""",
+        id="declared",
+    ),
+    pytest.param(
+        INTERFACE_SOL,
+        FunctionKey(
+            signature="interfaceMethod()",
+            contract_name="InterfaceA",
+            path="contracts/IInterface.sol",
+        ),
+        "contracts/IInterface.sol",
+        5,
+        5,
+        "    function interfaceMethod() external;\n",
+        id="single_line",
+    ),
+    pytest.param(
+        STANDALONE_SOL,
+        FunctionKey(
             signature="standaloneFunction(uint256,address)",
             contract_name="StandaloneContract",
             path="contracts/Standalone.sol",
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
-
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/Standalone.sol"
-        assert response.line_start == 15
-        assert response.line_end == 22
-        # Lines 15-22 should be extracted (includes closing brace from modifier)
-        expected_code = """    }
+        ),
+        "contracts/Standalone.sol",
+        15,
+        22,
+        """    }
     function standaloneFunction(uint256 _value, address _addr) public nonReentrant returns (bool) {
         require(_addr != address(0), "Invalid address");
         value = _value;
@@ -140,143 +196,146 @@ contract StandaloneContract {
         emit ValueSet(_value);
         return true;
     }
-"""
-        assert response.source_code == expected_code
-
-    def test_get_library_function_source(self, test_path, project_facts, library_b_key):
-        """Test getting source code for a library function."""
-        mock_source = """// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
-
-library LibraryB {
-    uint256 constant MAX = type(uint256).max;
-
-    function add(uint256 a, uint256 b) internal pure returns (uint256) {
-        require(a <= MAX - b, "Overflow");
-        return a + b;
-    }
-}
-"""
-        function_key = FunctionKey(
+""",
+        id="multi_line_with_params",
+    ),
+    pytest.param(
+        LIBRARY_SOL,
+        FunctionKey(
             signature="add(uint256,uint256)", contract_name="LibraryB", path="contracts/Library.sol"
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
-
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/Library.sol"
-        assert response.line_start == 7
-        assert response.line_end == 10
-        expected_code = """    function add(uint256 a, uint256 b) internal pure returns (uint256) {
+        ),
+        "contracts/Library.sol",
+        7,
+        10,
+        """    function add(uint256 a, uint256 b) internal pure returns (uint256) {
         require(a <= MAX - b, "Overflow");
         return a + b;
     }
-"""
-        assert response.source_code == expected_code
-
-    def test_get_child_contract_declared_function(
-        self, test_path, project_facts, child_contract_key
-    ):
-        """Test getting source code for a function declared in a child contract."""
-        mock_source = """// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
-
-import "./Base.sol";
-
-contract ChildContract is BaseContract {
-    address public owner;
-
-    modifier onlyOwner() {
-        require(msg.sender == owner, "Not owner");
-        _;
-    }
-    function childFunction(address _addr) public payable onlyOwner {
-        require(_addr != address(0), "Invalid");
-        owner = _addr;
-        // additional logic
-        emit OwnerChanged(_addr);
-    }
-
-    event OwnerChanged(address indexed newOwner);
-}
-"""
-        function_key = FunctionKey(
+""",
+        id="library",
+    ),
+    pytest.param(
+        CHILD_SOL,
+        FunctionKey(
             signature="childFunction(address)",
             contract_name="ChildContract",
             path="contracts/Child.sol",
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
-
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/Child.sol"
-        assert response.line_start == 12
-        assert response.line_end == 18
-        # Lines 12-18 should be extracted (includes closing brace from modifier)
-        expected_code = """    }
+        ),
+        "contracts/Child.sol",
+        12,
+        18,
+        """    }
     function childFunction(address _addr) public payable onlyOwner {
         require(_addr != address(0), "Invalid");
         owner = _addr;
         // additional logic
         emit OwnerChanged(_addr);
     }
-"""
-        assert response.source_code == expected_code
-
-    def test_get_inherited_function_source(self, test_path, project_facts, base_contract_key):
-        """Test getting source for an inherited function (returns the source from original contract)."""
-        # When we request a function from a child contract that inherits it,
-        # the FunctionModel in the inherited dict will point to the base contract's path
-        mock_source = """// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
-
-abstract contract BaseContract {
-    uint256 private data;
-
-    constructor() {
-        data = 0;
+""",
+        id="child_declared",
+    ),
+    pytest.param(
+        BASE_SOL,
+        FunctionKey(
+            signature="baseFunction()", contract_name="BaseContract", path="contracts/Base.sol"
+        ),
+        "contracts/Base.sol",
+        17,
+        20,
+        """    function baseFunction() internal view returns (uint256) {
+        return data;
     }
-    function initialize() public {
-        // initialization logic
-        data = 42;
-        emit Initialized(data);
+}
+""",
+        id="inherited",
+    ),
+    pytest.param(
+        GRANDCHILD_SOL,
+        FunctionKey(
+            signature="grandchildFunction()",
+            contract_name="GrandchildContract",
+            path="contracts/Grandchild.sol",
+        ),
+        "contracts/Grandchild.sol",
+        10,
+        13,
+        """        level = 3;
     }
+    function grandchildFunction() external view returns (bool) {
+        return level > 0;
+""",
+        id="grandchild",
+    ),
+    pytest.param(
+        MULTI_SOL,
+        FunctionKey(
+            signature="interfaceMethod()",
+            contract_name="MultiInheritContract",
+            path="contracts/Multi.sol",
+        ),
+        "contracts/Multi.sol",
+        8,
+        11,
+        """    function interfaceMethod() external override {
+        // Implementation
+        emit MethodCalled();
+    }
+""",
+        id="overridden",
+    ),
+    pytest.param(
+        MULTI_SOL,
+        FunctionKey(
+            signature="multiFunction()",
+            contract_name="MultiInheritContract",
+            path="contracts/Multi.sol",
+        ),
+        "contracts/Multi.sol",
+        13,
+        16,
+        """    function multiFunction() private {
+        // Private function
+        uint256 x = 42;
+    }
+""",
+        id="private",
+    ),
+]
 
 
-    function baseFunction() internal view returns (uint256) {
-        return data;
-    }
-}
-"""
-        # Request baseFunction from the base contract
-        function_key = FunctionKey(
-            signature="baseFunction()", contract_name="BaseContract", path="contracts/Base.sol"
-        )
+class TestGetFunctionSourceHappyPath:
+    """Test happy path scenarios for get_function_source."""
+
+    @pytest.fixture(autouse=True)
+    def _path_exists(self, monkeypatch):
+        """Treat the project directory and every source file as present."""
+        monkeypatch.setattr("os.path.exists", lambda path: True)
+
+    @pytest.mark.parametrize(
+        "mock_source,function_key,expected_path,line_start,line_end,expected_code", HAPPY_CASES
+    )
+    def test_get_function_source(
+        self,
+        test_path,
+        project_facts,
+        mock_source,
+        function_key,
+        expected_path,
+        line_start,
+        line_end,
+        expected_code,
+    ):
+        """Test getting source code for declared, inherited, and overridden functions."""
         request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
 
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
+        with _fake_open(mock_source):
+            response = get_function_source(request, project_facts)
 
         assert response.success is True
         assert response.error_message is None
-        assert response.file_path == "contracts/Base.sol"
-        assert response.line_start == 17
-        assert response.line_end == 20
-        # Lines 17-20 includes the function and contract closing brace
-        expected_code = """    function baseFunction() internal view returns (uint256) {
-        return data;
-    }
-}
-"""
+        assert response.file_path == expected_path
+        assert response.line_start == line_start
+        assert response.line_end == line_end
         assert response.source_code == expected_code
 
 
@@ -365,7 +424,7 @@ pragma solidity ^0.8.0;
         request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
 
         # Function model says lines 10-15, but file only has 5 lines
-        with patch("builtins.open", mock_open(read_data=mock_source)):
+        with _fake_open(mock_source):
             with patch("os.path.exists", return_value=True):
                 response = get_function_source(request, project_facts)
 
@@ -398,136 +457,3 @@ pragma solidity ^0.8.0;
         assert response.success is False
         assert response.error_message is not None
         assert response.source_code is None
-
-
-class TestGetFunctionSourceWithComplexInheritance:
-    """Test get_function_source with complex inheritance scenarios."""
-
-    def test_get_function_from_grandchild(self, test_path, project_facts, grandchild_contract_key):
-        """Test getting a function declared in a grandchild contract."""
-        mock_source = """// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
-
-import "./Child.sol";
-
-contract GrandchildContract is ChildContract {
-    uint256 public level;
-
-    constructor() {
-        level = 3;
-    }
-    function grandchildFunction() external view returns (bool) {
-        return level > 0;
-    }
-}
-"""
-        function_key = FunctionKey(
-            signature="grandchildFunction()",
-            contract_name="GrandchildContract",
-            path="contracts/Grandchild.sol",
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
-
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/Grandchild.sol"
-        assert response.line_start == 10
-        assert response.line_end == 13
-        # Lines 10-13 includes part of the constructor and the function start
-        expected_code = """        level = 3;
-    }
-    function grandchildFunction() external view returns (bool) {
-        return level > 0;
-"""
-        assert response.source_code == expected_code
-
-    def test_get_overridden_function(self, test_path, project_facts, multi_inherit_contract_key):
-        """Test getting an overridden function from a multi-inheritance contract."""
-        mock_source = """// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
-
-import "./Base.sol";
-import "./IInterface.sol";
-
-contract MultiInheritContract is BaseContract, InterfaceA {
-    function interfaceMethod() external override {
-        // Implementation
-        emit MethodCalled();
-    }
-
-    function multiFunction() private {
-        // Private function
-        uint256 x = 42;
-    }
-}
-"""
-        function_key = FunctionKey(
-            signature="interfaceMethod()",
-            contract_name="MultiInheritContract",
-            path="contracts/Multi.sol",
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
-
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/Multi.sol"
-        assert response.line_start == 8
-        assert response.line_end == 11
-        # Lines 8-11 includes the function
-        expected_code = """    function interfaceMethod() external override {
-        // Implementation
-        emit MethodCalled();
-    }
-"""
-        assert response.source_code == expected_code
-
-    def test_get_private_function(self, test_path, project_facts, multi_inherit_contract_key):
-        """Test getting a private function's source."""
-        mock_source = """// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
-
-import "./Base.sol";
-import "./IInterface.sol";
-
-contract MultiInheritContract is BaseContract, InterfaceA {
-    function interfaceMethod() external override {
-        // Implementation
-        emit MethodCalled();
-    }
-
-    function multiFunction() private {
-        // Private function
-        uint256 x = 42;
-    }
-}
-"""
-        function_key = FunctionKey(
-            signature="multiFunction()",
-            contract_name="MultiInheritContract",
-            path="contracts/Multi.sol",
-        )
-        request = GetFunctionSourceRequest(path=test_path, function_key=function_key)
-
-        with patch("builtins.open", mock_open(read_data=mock_source)):
-            with patch("os.path.exists", return_value=True):
-                response = get_function_source(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.file_path == "contracts/Multi.sol"
-        assert response.line_start == 13
-        assert response.line_end == 16
-        expected_code = """    function multiFunction() private {
-        // Private function
-        uint256 x = 42;
-    }
-"""
-        assert response.source_code == expected_code
@@ -1,11 +1,33 @@
 """Tests for get_inherited_contracts tool."""
 
+import sys
+
+import pytest
+from pydantic import ValidationError
+
 from slither_mcp.tools.get_inherited_contracts import (
     GetInheritedContractsRequest,
     build_inheritance_tree,
     get_inherited_contracts,
 )
-from slither_mcp.types import ContractKey
+from slither_mcp.types import ContractKey, ContractModel, ProjectFacts
+
+
+def _make_contract(key: ContractKey, parents: list[ContractKey]) -> ContractModel:
+    """Create a minimal ContractModel with the given direct parents."""
+    return ContractModel(
+        name=key.contract_name,
+        key=key,
+        path=key.path,
+        is_abstract=False,
+        is_fully_implemented=True,
+        is_interface=False,
+        is_library=False,
+        directly_inherits=parents,
+        scopes=[key, *parents],
+        functions_declared={},
+        functions_inherited={},
+    )
 
 
 class TestGetInheritedContractsHappyPath:
@@ -96,10 +118,21 @@ class TestGetInheritedContractsHappyPath:
         for parent in root.inherits:
             assert len(parent.inherits) == 0
 
-    def test_no_inheritance(self, test_path, project_facts, standalone_contract_key):
-        """Test getting inherited contracts for a contract with no parents."""
-        request = GetInheritedContractsRequest(path=test_path, contract_key=standalone_contract_key)
-        response = get_inherited_contracts(request, project_facts)
+    @pytest.mark.parametrize(
+        "key_fixture",
+        [
+            pytest.param("standalone_contract_key", id="no_inheritance"),
+            pytest.param("interface_a_key", id="interface"),
+            pytest.param("library_b_key", id="library"),
+            pytest.param("base_contract_key", id="abstract"),
+            pytest.param("empty_contract_key", id="empty_contract"),
+        ],
+    )
+    def test_leaf_contract(self, request, test_path, project_facts, key_fixture):
+        """Test getting inherited contracts for contracts with no parents."""
+        contract_key = request.getfixturevalue(key_fixture)
+        tool_request = GetInheritedContractsRequest(path=test_path, contract_key=contract_key)
+        response = get_inherited_contracts(tool_request, project_facts)
 
         assert response.success is True
         assert response.error_message is None
@@ -107,46 +140,7 @@ class TestGetInheritedContractsHappyPath:
 
         # Should have root node with no parents
         root = response.full_inheritance
-        assert root.contract_key == standalone_contract_key
-        assert len(root.inherits) == 0
-
-    def test_interface_inheritance(self, test_path, project_facts, interface_a_key):
-        """Test getting inherited contracts for an interface."""
-        request = GetInheritedContractsRequest(path=test_path, contract_key=interface_a_key)
-        response = get_inherited_contracts(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.full_inheritance is not None
-
-        root = response.full_inheritance
-        assert root.contract_key == interface_a_key
-        assert len(root.inherits) == 0
-
-    def test_library_inheritance(self, test_path, project_facts, library_b_key):
-        """Test getting inherited contracts for a library."""
-        request = GetInheritedContractsRequest(path=test_path, contract_key=library_b_key)
-        response = get_inherited_contracts(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.full_inheritance is not None
-
-        root = response.full_inheritance
-        assert root.contract_key == library_b_key
-        assert len(root.inherits) == 0
-
-    def test_abstract_contract_inheritance(self, test_path, project_facts, base_contract_key):
-        """Test getting inherited contracts for an abstract contract."""
-        request = GetInheritedContractsRequest(path=test_path, contract_key=base_contract_key)
-        response = get_inherited_contracts(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.full_inheritance is not None
-
-        root = response.full_inheritance
-        assert root.contract_key == base_contract_key
+        assert root.contract_key == contract_key
         assert len(root.inherits) == 0
 
 
@@ -177,128 +171,99 @@ class TestGetInheritedContractsErrorCases:
         assert response.full_inheritance is None
 
 
-class TestGetInheritedContractsEdgeCases:
-    """Test edge cases for get_inherited_contracts."""
+class TestGetInheritedContractsCaching:
+    """Test that finished trees are reused across requests."""
 
-    def test_circular_dependency_prevention(self, test_path, project_facts):
-        """Test that circular dependencies are handled gracefully."""
-        from slither_mcp.types import ContractModel, ProjectFacts
-
-        # Create two contracts that inherit from each other (circular)
-        contract_a_key = ContractKey(contract_name="ContractA", path="contracts/A.sol")
-        contract_b_key = ContractKey(contract_name="ContractB", path="contracts/B.sol")
-
-        # ContractA inherits from ContractB
-        contract_a = ContractModel(
-            name="ContractA",
-            key=contract_a_key,
-            path="contracts/A.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[contract_b_key],
-            scopes=[contract_a_key, contract_b_key],
-            functions_declared={},
-            functions_inherited={},
+    def test_second_call_is_cached(
+        self, monkeypatch, test_path, project_facts, grandchild_contract_key
+    ):
+        """Test that an identical request does not rebuild the tree."""
+        calls = []
+
+        def counting_build(*args, **kwargs):
+            calls.append(args[0])
+            return build_inheritance_tree(*args, **kwargs)
+
+        module = sys.modules[get_inherited_contracts.__module__]
+        monkeypatch.setattr(module, "build_inheritance_tree", counting_build)
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        request = GetInheritedContractsRequest(
+            path=test_path, contract_key=grandchild_contract_key, max_depth=1
         )
+        first = get_inherited_contracts(request, facts)
+        second = get_inherited_contracts(request, facts)
+
+        assert calls == [grandchild_contract_key]
+        assert second.full_inheritance is first.full_inheritance
+        assert second.truncated is first.truncated is True
 
-        # ContractB inherits from ContractA (circular!)
-        contract_b = ContractModel(
-            name="ContractB",
-            key=contract_b_key,
-            path="contracts/B.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[contract_a_key],
-            scopes=[contract_b_key, contract_a_key],
-            functions_declared={},
-            functions_inherited={},
+        # A different depth is a different tree
+        deeper = GetInheritedContractsRequest(
+            path=test_path, contract_key=grandchild_contract_key, max_depth=2
         )
+        get_inherited_contracts(deeper, facts)
+        assert len(calls) == 2
 
-        circular_project = ProjectFacts(
-            contracts={
-                contract_a_key: contract_a,
-                contract_b_key: contract_b,
-            },
-            project_dir="/test/circular",
+    def test_cache_is_per_project_facts(self, test_path, project_facts, child_contract_key):
+        """Test that cached trees live on the ProjectFacts they were built from."""
+        request = GetInheritedContractsRequest(path=test_path, contract_key=child_contract_key)
+        first = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/first")
+        second = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/second")
+
+        first_tree = get_inherited_contracts(request, first).full_inheritance
+        second_tree = get_inherited_contracts(request, second).full_inheritance
+
+        assert first_tree == second_tree
+        assert first_tree is not second_tree
+        assert ("get_inherited_contracts", child_contract_key, request.max_depth) in (
+            first.query_cache
         )
 
+    def test_cached_trees_are_bounded(
+        self, monkeypatch, test_path, project_facts, child_contract_key
+    ):
+        """Test that requests with varying depths keep at most QUERY_CACHE_MAXSIZE trees."""
+        monkeypatch.setattr("slither_mcp.types.QUERY_CACHE_MAXSIZE", 2)
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/bounded")
+        for max_depth in (1, 2, 3):
+            request = GetInheritedContractsRequest(
+                path=test_path, contract_key=child_contract_key, max_depth=max_depth
+            )
+            get_inherited_contracts(request, facts)
+
+        assert [key[-1] for key in facts.query_cache] == [2, 3]
+
+
+class TestGetInheritedContractsEdgeCases:
+    """Test edge cases for get_inherited_contracts."""
+
+    def test_circular_dependency_prevention(
+        self, test_path, circular_project_facts, circular_a_key
+    ):
+        """Test that circular dependencies are handled gracefully."""
         # Should handle circular dependency without infinite recursion
-        request = GetInheritedContractsRequest(path=test_path, contract_key=contract_a_key)
-        response = get_inherited_contracts(request, circular_project)
+        request = GetInheritedContractsRequest(path=test_path, contract_key=circular_a_key)
+        response = get_inherited_contracts(request, circular_project_facts)
 
+        assert circular_a_key in circular_project_facts.cyclic_inheritance
         assert response.success is True
         assert response.full_inheritance is not None
         # The tree should be built but not recurse infinitely
 
-    def test_self_referencing_contract(self, test_path, project_facts):
+    def test_self_referencing_contract(self, test_path, self_ref_project_facts, self_ref_key):
         """Test contract that lists itself in inheritance (edge case)."""
-        from slither_mcp.types import ContractModel, ProjectFacts
-
-        self_ref_key = ContractKey(contract_name="SelfRef", path="contracts/SelfRef.sol")
-
-        # Contract that inherits from itself (should never happen in real code)
-        self_ref_contract = ContractModel(
-            name="SelfRef",
-            key=self_ref_key,
-            path="contracts/SelfRef.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[self_ref_key],  # Self-reference
-            scopes=[self_ref_key],
-            functions_declared={},
-            functions_inherited={},
-        )
-
-        self_ref_project = ProjectFacts(
-            contracts={self_ref_key: self_ref_contract},
-            project_dir="/test/self_ref",
-        )
-
         request = GetInheritedContractsRequest(path=test_path, contract_key=self_ref_key)
-        response = get_inherited_contracts(request, self_ref_project)
+        response = get_inherited_contracts(request, self_ref_project_facts)
 
         assert response.success is True
         # Should handle self-reference without infinite recursion
         assert response.full_inheritance is not None
         assert response.full_inheritance.contract_key == self_ref_key
 
-    def test_missing_parent_contract(self, test_path, project_facts):
+    def test_missing_parent_contract(self, test_path, orphan_project_facts, orphan_key):
         """Test contract that inherits from non-existent parent."""
-        from slither_mcp.types import ContractModel, ProjectFacts
-
-        orphan_key = ContractKey(contract_name="Orphan", path="contracts/Orphan.sol")
-        missing_parent_key = ContractKey(
-            contract_name="MissingParent", path="contracts/Missing.sol"
-        )
-
-        # Contract with reference to non-existent parent
-        orphan_contract = ContractModel(
-            name="Orphan",
-            key=orphan_key,
-            path="contracts/Orphan.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[missing_parent_key],
-            scopes=[orphan_key, missing_parent_key],
-            functions_declared={},
-            functions_inherited={},
-        )
-
-        orphan_project = ProjectFacts(
-            contracts={orphan_key: orphan_contract},
-            project_dir="/test/orphan",
-        )
-
         request = GetInheritedContractsRequest(path=test_path, contract_key=orphan_key)
-        response = get_inherited_contracts(request, orphan_project)
+        response = get_inherited_contracts(request, orphan_project_facts)
 
         assert response.success is True
         # Should still build the tree, with missing parent as leaf
@@ -307,19 +272,6 @@ class TestGetInheritedContractsEdgeCases:
         # Missing parent should have empty inherits list
         assert len(response.full_inheritance.inherits[0].inherits) == 0
 
-    def test_empty_contract_with_inheritance(self, test_path, project_facts, empty_contract_key):
-        """Test getting inheritance for empty contract (no functions but valid)."""
-        request = GetInheritedContractsRequest(path=test_path, contract_key=empty_contract_key)
-        response = get_inherited_contracts(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.full_inheritance is not None
-
-        root = response.full_inheritance
-        assert root.contract_key == empty_contract_key
-        assert len(root.inherits) == 0
-
 
 class TestBuildInheritanceTree:
     """Test the build_inheritance_tree function directly."""
@@ -349,6 +301,8 @@ class TestBuildInheritanceTree:
         assert len(tree.inherits) == 1
         assert tree.inherits[0].contract_key == child_contract_key
         assert len(tree.inherits[0].inherits) == 0  # Stopped by visited set
+        # Contracts added while walking the tree are removed again on the way back up
+        assert visited == {child_contract_key}
 
     def test_build_tree_nonexistent_contract(self, test_path, project_facts):
         """Test building tree for non-existent contract."""
@@ -376,3 +330,53 @@ class TestBuildInheritanceTree:
         assert tree.inherits[0].contract_key == child_contract_key
         assert len(tree.inherits[0].inherits) == 1
         assert tree.inherits[0].inherits[0].contract_key == base_contract_key
+
+    def test_diamond_shared_ancestor_reused(self):
+        """Test that an ancestor reached through two parents is built once and shared."""
+        a_key = ContractKey(contract_name="A", path="contracts/A.sol")
+        b_key = ContractKey(contract_name="B", path="contracts/B.sol")
+        c_key = ContractKey(contract_name="C", path="contracts/C.sol")
+        d_key = ContractKey(contract_name="D", path="contracts/D.sol")
+        diamond_project = ProjectFacts(
+            contracts={
+                a_key: _make_contract(a_key, [b_key, c_key]),
+                b_key: _make_contract(b_key, [d_key]),
+                c_key: _make_contract(c_key, [d_key]),
+                d_key: _make_contract(d_key, []),
+            },
+            project_dir="/test/diamond",
+        )
+
+        tree = build_inheritance_tree(a_key, diamond_project)
+
+        assert [node.contract_key for node in tree.inherits] == [b_key, c_key]
+        assert tree.inherits[0].inherits[0].contract_key == d_key
+        assert tree.inherits[0].inherits[0] is tree.inherits[1].inherits[0]
+
+    def test_nodes_are_immutable(self, project_facts, grandchild_contract_key):
+        """Test that shared tree nodes cannot be modified."""
+        tree = build_inheritance_tree(grandchild_contract_key, project_facts)
+
+        with pytest.raises(ValidationError):
+            tree.inherits = ()
+        assert len(tree.inherits) == 1
+
+    def test_very_deep_chain_does_not_recurse(self):
+        """Test that a chain deeper than the recursion limit is built without error."""
+        keys = [ContractKey(contract_name=f"C{i}", path=f"contracts/C{i}.sol") for i in range(2000)]
+        chain_project = ProjectFacts(
+            contracts={
+                key: _make_contract(key, [keys[i + 1]] if i + 1 < len(keys) else [])
+                for i, key in enumerate(keys)
+            },
+            project_dir="/test/chain",
+        )
+
+        node = build_inheritance_tree(keys[0], chain_project)
+
+        depth = 0
+        while node.inherits:
+            node = node.inherits[0]
+            depth += 1
+        assert depth == len(keys) - 1
+        assert node.contract_key == keys[-1]
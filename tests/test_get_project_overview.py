@@ -1,10 +1,14 @@
 """Tests for get_project_overview tool."""
 
+import pytest
+from pydantic import ValidationError
+
 from slither_mcp.tools.get_project_overview import (
+    ComplexityDistribution,
     GetProjectOverviewRequest,
     get_project_overview,
 )
-from slither_mcp.types import ProjectFacts
+from slither_mcp.types import ContractKey, ContractModel, FunctionModel, ProjectFacts
 
 
 def test_get_project_overview_basic(project_facts: ProjectFacts, test_path: str):
@@ -81,6 +85,48 @@ def test_get_project_overview_complexity_distribution(project_facts: ProjectFact
     assert total_complexity == overview.function_counts.total_declared
 
 
+def test_get_project_overview_complexity_bucket_boundaries(empty_callees, test_path: str):
+    """Test that each complexity bucket includes its upper line limit."""
+    key = ContractKey(contract_name="Sizes", path="contracts/Sizes.sol")
+    line_counts = [10, 11, 30, 31, 100, 101]
+    functions = {
+        f"f{lines}()": FunctionModel(
+            signature=f"f{lines}()",
+            implementation_contract=key,
+            solidity_modifiers=["public"],
+            visibility="public",
+            function_modifiers=[],
+            arguments=[],
+            returns=[],
+            path="contracts/Sizes.sol",
+            line_start=1,
+            line_end=lines,
+            callees=empty_callees,
+        )
+        for lines in line_counts
+    }
+    contract = ContractModel(
+        name="Sizes",
+        key=key,
+        path="contracts/Sizes.sol",
+        is_abstract=False,
+        is_fully_implemented=True,
+        is_interface=False,
+        is_library=False,
+        directly_inherits=[],
+        scopes=[key],
+        functions_declared=functions,
+        functions_inherited={},
+    )
+    facts = ProjectFacts(contracts={key: contract}, project_dir="/test/sizes")
+
+    response = get_project_overview(GetProjectOverviewRequest(path=test_path), facts)
+
+    assert response.overview.complexity_distribution == ComplexityDistribution(
+        small=1, medium=2, large=2, very_large=1
+    )
+
+
 def test_get_project_overview_empty_project(empty_project_facts: ProjectFacts, test_path: str):
     """Test project overview with empty project."""
     request = GetProjectOverviewRequest(path=test_path)
@@ -159,3 +205,34 @@ def test_get_project_overview_detector_finding_structure(
         assert detector.name is not None
         assert detector.finding_count > 0
         assert detector.impact is not None
+
+
+def test_get_project_overview_is_computed_once(project_facts: ProjectFacts, test_path: str):
+    """Test that repeated requests reuse the overview computed for the same facts."""
+    facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/overview")
+    request = GetProjectOverviewRequest(path=test_path)
+
+    first = get_project_overview(request, facts)
+    second = get_project_overview(request, facts)
+
+    assert second.overview is first.overview
+    # Different facts get their own overview
+    assert get_project_overview(request, project_facts).overview is not first.overview
+
+
+def test_cached_overview_cannot_be_modified(
+    project_facts_with_detectors: ProjectFacts, test_path: str
+):
+    """Test that callers cannot change the overview shared through the cache."""
+    facts = ProjectFacts(
+        contracts=project_facts_with_detectors.contracts,
+        detector_results=project_facts_with_detectors.detector_results,
+        project_dir="/test/overview",
+    )
+    overview = get_project_overview(GetProjectOverviewRequest(path=test_path), facts).overview
+
+    with pytest.raises(ValidationError):
+        overview.contract_counts.total = 0
+    with pytest.raises(ValidationError):
+        overview.top_detectors[0].finding_count = 0
+    assert isinstance(overview.top_detectors, tuple)
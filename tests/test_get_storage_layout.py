@@ -1,7 +1,11 @@
 """Tests for get_storage_layout tool."""
 
+import pytest
+
 from slither_mcp.tools.get_storage_layout import (
     GetStorageLayoutRequest,
+    _get_type_size,
+    _requires_new_slot,
     get_storage_layout,
 )
 from slither_mcp.types import ContractKey, ProjectFacts
@@ -192,3 +196,110 @@ def test_get_storage_layout_base_contract(
     # Should not be marked as inherited since it's declared in this contract
     assert not slot.is_inherited
     assert slot.declaring_contract == "BaseContract"
+
+
+def test_get_storage_layout_circular_inheritance(
+    circular_project_facts: ProjectFacts, circular_a_key: ContractKey, test_path: str
+):
+    """Test that a circular hierarchy falls back to walking the graph without looping."""
+    request = GetStorageLayoutRequest(path=test_path, contract_key=circular_a_key)
+    response = get_storage_layout(request, circular_project_facts)
+
+    assert response.success
+    # Parents come first and each contract is visited once, even though ContractB
+    # lists ContractA as its parent again
+    layout = [
+        (s.declaring_contract, s.variable_name, s.slot, s.offset, s.is_inherited)
+        for s in response.storage_slots
+    ]
+    assert layout == [
+        ("ContractB", "total", 0, 0, True),
+        ("ContractB", "owner", 1, 0, True),
+        ("ContractA", "paused", 1, 20, False),
+        ("ContractA", "balance", 2, 0, False),
+    ]
+    assert response.total_count == 4
+    assert response.total_slots_used == 3
+
+
+def test_get_storage_layout_circular_inheritance_from_other_side(
+    circular_project_facts: ProjectFacts, circular_b_key: ContractKey, test_path: str
+):
+    """Test that walking the cycle from ContractB puts ContractA's variables first."""
+    request = GetStorageLayoutRequest(path=test_path, contract_key=circular_b_key)
+    response = get_storage_layout(request, circular_project_facts)
+
+    assert response.success
+    assert [(s.declaring_contract, s.variable_name) for s in response.storage_slots] == [
+        ("ContractA", "paused"),
+        ("ContractA", "balance"),
+        ("ContractB", "total"),
+        ("ContractB", "owner"),
+    ]
+
+
+def test_get_storage_layout_reuses_layout_across_pages(project_facts: ProjectFacts, test_path: str):
+    """Test that later pages are sliced from the layout computed for the first request."""
+    facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/layout")
+    child_key = ContractKey(contract_name="ChildContract", path="contracts/Child.sol")
+    first_page = get_storage_layout(
+        GetStorageLayoutRequest(path=test_path, contract_key=child_key, limit=1), facts
+    )
+    full = get_storage_layout(
+        GetStorageLayoutRequest(path=test_path, contract_key=child_key), facts
+    )
+
+    assert full.storage_slots[0] is first_page.storage_slots[0]
+    assert full.total_slots_used == first_page.total_slots_used
+    assert list(facts.query_cache) == [("get_storage_layout", child_key, True)]
+
+
+def test_get_storage_layout_cached_layouts_are_bounded(
+    monkeypatch: pytest.MonkeyPatch,
+    project_facts: ProjectFacts,
+    base_contract_key: ContractKey,
+    child_contract_key: ContractKey,
+    test_path: str,
+):
+    """Test that requests for many layouts keep at most QUERY_CACHE_MAXSIZE of them."""
+    monkeypatch.setattr("slither_mcp.types.QUERY_CACHE_MAXSIZE", 2)
+    facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/bounded")
+    for contract_key, include_inherited in (
+        (base_contract_key, True),
+        (child_contract_key, True),
+        (child_contract_key, False),
+    ):
+        request = GetStorageLayoutRequest(
+            path=test_path, contract_key=contract_key, include_inherited=include_inherited
+        )
+        get_storage_layout(request, facts)
+
+    assert list(facts.query_cache) == [
+        ("get_storage_layout", child_contract_key, True),
+        ("get_storage_layout", child_contract_key, False),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("type_str", "size", "new_slot"),
+    [
+        ("uint256", 32, False),
+        ("address", 20, False),
+        ("bool", 1, False),
+        (" uint8 ", 1, False),
+        ("bytes4", 4, False),
+        ("contract IERC20", 20, False),
+        ("enum Status", 1, False),
+        ("string", 32, True),
+        ("bytes", 32, True),
+        ("mapping(address => uint256)", 32, True),
+        ("uint256[]", 32, True),
+        ("address[5]", 32, True),
+        ("struct Position", 32, True),
+        ("SomeUnknownType", 32, False),
+    ],
+)
+def test_type_size_and_packing(type_str: str, size: int, new_slot: bool):
+    """Test storage size and slot alignment for elementary and complex types."""
+    assert _get_type_size(type_str) == size
+    assert _requires_new_slot(type_str) is new_slot
@@ -1,9 +1,25 @@
 """Tests for list_contracts tool."""
 
+import pytest
+from pydantic import ValidationError
+
 from slither_mcp.tools.list_contracts import (
     ListContractsRequest,
     list_contracts,
 )
+from slither_mcp.types import ProjectFacts
+
+
+@pytest.fixture(scope="module")
+def all_contracts_response(test_path, project_facts):
+    """Unfiltered list_contracts response, shared by tests that only inspect it."""
+    return list_contracts(ListContractsRequest(path=test_path), project_facts)
+
+
+@pytest.fixture(scope="module")
+def contracts_by_name(all_contracts_response):
+    """Contracts from the unfiltered response, keyed by contract name."""
+    return {c.key.contract_name: c for c in all_contracts_response.contracts}
 
 
 class TestListContractsHappyPath:
@@ -11,7 +27,7 @@ class TestListContractsHappyPath:
 
     def test_list_all_contracts(self, test_path, project_facts):
         """Test listing all contracts without filters."""
-        request = ListContractsRequest(path=test_path, filter_type="all")
+        request = ListContractsRequest(path=test_path)
         response = list_contracts(request, project_facts)
 
         assert response.success is True
@@ -33,80 +49,49 @@ class TestListContractsHappyPath:
         }
         assert contract_names == expected_names
 
-    def test_list_concrete_contracts(self, test_path, project_facts):
-        """Test listing only concrete (non-abstract, non-interface, non-library) contracts."""
-        request = ListContractsRequest(path=test_path, filter_type="concrete")
+    @pytest.mark.parametrize(
+        "filter_type,expected_names,flag",
+        [
+            (
+                "concrete",
+                {
+                    "ChildContract",
+                    "GrandchildContract",
+                    "MultiInheritContract",
+                    "StandaloneContract",
+                    "EmptyContract",
+                },
+                None,
+            ),
+            ("interface", {"InterfaceA"}, "is_interface"),
+            ("library", {"LibraryB"}, "is_library"),
+            ("abstract", {"BaseContract"}, "is_abstract"),
+        ],
+    )
+    def test_list_filtered_contracts(
+        self, test_path, project_facts, filter_type, expected_names, flag
+    ):
+        """Test that each filter_type returns exactly the matching contracts."""
+        request = ListContractsRequest(path=test_path, filter_type=filter_type)
         response = list_contracts(request, project_facts)
 
         assert response.success is True
         assert response.error_message is None
-        assert response.total_count == 5
+        assert response.total_count == len(expected_names)
+        assert {c.key.contract_name for c in response.contracts} == expected_names
 
-        # Should include concrete contracts only
-        contract_names = {c.key.contract_name for c in response.contracts}
-        expected_names = {
-            "ChildContract",
-            "GrandchildContract",
-            "MultiInheritContract",
-            "StandaloneContract",
-            "EmptyContract",
-        }
-        assert contract_names == expected_names
-
-        # Verify they are all concrete
         for contract in response.contracts:
-            assert contract.is_abstract is False
-            assert contract.is_interface is False
-            assert contract.is_library is False
-
-    def test_list_interface_contracts(self, test_path, project_facts):
-        """Test listing only interface contracts."""
-        request = ListContractsRequest(path=test_path, filter_type="interface")
-        response = list_contracts(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.total_count == 1
-        assert len(response.contracts) == 1
-
-        contract = response.contracts[0]
-        assert contract.key.contract_name == "InterfaceA"
-        assert contract.is_interface is True
-
-    def test_list_library_contracts(self, test_path, project_facts):
-        """Test listing only library contracts."""
-        request = ListContractsRequest(path=test_path, filter_type="library")
-        response = list_contracts(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.total_count == 1
-        assert len(response.contracts) == 1
-
-        contract = response.contracts[0]
-        assert contract.key.contract_name == "LibraryB"
-        assert contract.is_library is True
-
-    def test_list_abstract_contracts(self, test_path, project_facts):
-        """Test listing only abstract contracts."""
-        request = ListContractsRequest(path=test_path, filter_type="abstract")
-        response = list_contracts(request, project_facts)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.total_count == 1
-        assert len(response.contracts) == 1
-
-        contract = response.contracts[0]
-        assert contract.key.contract_name == "BaseContract"
-        assert contract.is_abstract is True
-
-    def test_contract_info_completeness(self, test_path, project_facts):
+            if flag is None:
+                # Concrete contracts carry none of the kind flags
+                assert contract.is_abstract is False
+                assert contract.is_interface is False
+                assert contract.is_library is False
+            else:
+                assert getattr(contract, flag) is True
+
+    def test_contract_info_completeness(self, all_contracts_response):
         """Test that ContractInfo contains all required fields."""
-        request = ListContractsRequest(path=test_path, filter_type="all")
-        response = list_contracts(request, project_facts)
-
-        for contract in response.contracts:
+        for contract in all_contracts_response.contracts:
             # Verify all fields are present and have expected types
             assert isinstance(contract.key.contract_name, str)
             assert isinstance(contract.key.path, str)
@@ -121,7 +106,7 @@ class TestListContractsEdgeCases:
 
     def test_empty_project(self, test_path, empty_project_facts):
         """Test listing contracts in an empty project."""
-        request = ListContractsRequest(path=test_path, filter_type="all")
+        request = ListContractsRequest(path=test_path)
         response = list_contracts(request, empty_project_facts)
 
         assert response.success is True
@@ -139,19 +124,11 @@ class TestListContractsEdgeCases:
         assert response.total_count == 0
         assert len(response.contracts) == 0
 
-    def test_filter_with_no_matches(self, test_path, project_facts):
+    def test_filter_with_no_matches(self, test_path, abstract_only_project_facts):
         """Test that filtering returns empty list when no contracts match."""
-        # Create a project with only abstract contracts
-        from slither_mcp.types import ProjectFacts
-
-        abstract_only = ProjectFacts(
-            contracts={k: v for k, v in project_facts.contracts.items() if v.is_abstract},
-            project_dir="/test/abstract_only",
-        )
-
-        # Request concrete contracts (should find none)
+        # Request interfaces from a project with only abstract contracts (should find none)
         request = ListContractsRequest(path=test_path, filter_type="interface")
-        response = list_contracts(request, abstract_only)
+        response = list_contracts(request, abstract_only_project_facts)
 
         assert response.success is True
         assert response.error_message is None
@@ -166,14 +143,8 @@ class TestListContractsEdgeCases:
         assert response.success is True
         assert response.total_count == 8  # Should list all contracts
 
-    def test_contract_properties_accuracy(self, test_path, project_facts):
+    def test_contract_properties_accuracy(self, contracts_by_name):
         """Test that contract properties accurately reflect their types."""
-        request = ListContractsRequest(path=test_path, filter_type="all")
-        response = list_contracts(request, project_facts)
-
-        # Find specific contracts and verify their properties
-        contracts_by_name = {c.key.contract_name: c for c in response.contracts}
-
         # BaseContract should be abstract
         base = contracts_by_name["BaseContract"]
         assert base.is_abstract is True
@@ -195,6 +166,54 @@ class TestListContractsEdgeCases:
         assert child.is_fully_implemented is True
 
 
+class TestListContractsCaching:
+    """Tests for reuse of filtered listings across requests."""
+
+    def test_pages_share_one_listing(self, test_path, project_facts):
+        """Test that every page of a listing is sliced from one cached result."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        first = list_contracts(ListContractsRequest(path=test_path, sort_by="name", limit=3), facts)
+        second = list_contracts(
+            ListContractsRequest(path=test_path, sort_by="name", offset=3, limit=3), facts
+        )
+
+        cached = facts.query_cache[("list_contracts", "all", "name", "asc", None)]
+        assert first.contracts + second.contracts == cached[:6]
+        assert first.total_count == second.total_count == 8
+        assert len(facts.query_cache) == 1
+
+    def test_exclude_paths_are_part_of_the_key(self, test_path, project_facts_with_lib_and_test):
+        """Test that requests excluding different paths are cached separately."""
+        facts = ProjectFacts(
+            contracts=project_facts_with_lib_and_test.contracts, project_dir="/test/cached"
+        )
+        everything = list_contracts(ListContractsRequest(path=test_path), facts)
+        without_lib = list_contracts(
+            ListContractsRequest(path=test_path, exclude_paths=["lib/"]), facts
+        )
+
+        assert "LibDependency" in {c.key.contract_name for c in everything.contracts}
+        assert "LibDependency" not in {c.key.contract_name for c in without_lib.contracts}
+        assert len(facts.query_cache) == 2
+
+    def test_listings_are_evicted_past_the_cache_size(self, monkeypatch, test_path, project_facts):
+        """Test that varying the request keeps at most QUERY_CACHE_MAXSIZE listings."""
+        monkeypatch.setattr("slither_mcp.types.QUERY_CACHE_MAXSIZE", 2)
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        for prefix in ("lib/", "test/", "src/"):
+            list_contracts(ListContractsRequest(path=test_path, exclude_paths=[prefix]), facts)
+
+        assert [key[-1] for key in facts.query_cache] == [("test/",), ("src/",)]
+
+    def test_cached_contracts_cannot_be_modified(self, test_path, project_facts):
+        """Test that callers cannot change the contract infos shared through the cache."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        response = list_contracts(ListContractsRequest(path=test_path), facts)
+
+        with pytest.raises(ValidationError):
+            response.contracts[0].function_count = 0
+
+
 class TestListContractsExcludePaths:
     """Tests for exclude_paths parameter."""
 
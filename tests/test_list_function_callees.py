@@ -135,9 +135,8 @@ def grandchild_with_complex_callees(
     grandchild_contract_key,
     child_contract_key,
     base_contract_key,
+    child_with_callees,
     callees_with_all_types,
-    callees_with_internal,
-    empty_callees,
 ):
     """GrandchildContract with complex callees including all types."""
     return ContractModel(
@@ -165,46 +164,10 @@ def grandchild_with_complex_callees(
                 callees=callees_with_all_types,  # Complex callees
             ),
         },
+        # Reuse the parent's models instead of re-declaring the inheritance chain
         functions_inherited={
-            "childFunction(address)": FunctionModel(
-                signature="childFunction(address)",
-                implementation_contract=child_contract_key,
-                solidity_modifiers=["public", "payable"],
-                visibility="public",
-                function_modifiers=["onlyOwner"],
-                arguments=["address"],
-                returns=[],
-                path="contracts/Child.sol",
-                line_start=12,
-                line_end=18,
-                callees=callees_with_internal,
-            ),
-            "initialize()": FunctionModel(
-                signature="initialize()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["public"],
-                visibility="public",
-                function_modifiers=[],
-                arguments=[],
-                returns=[],
-                path="contracts/Base.sol",
-                line_start=10,
-                line_end=15,
-                callees=empty_callees,
-            ),
-            "baseFunction()": FunctionModel(
-                signature="baseFunction()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["internal", "view"],
-                visibility="internal",
-                function_modifiers=[],
-                arguments=[],
-                returns=["uint256"],
-                path="contracts/Base.sol",
-                line_start=17,
-                line_end=20,
-                callees=empty_callees,
-            ),
+            **child_with_callees.functions_declared,
+            **child_with_callees.functions_inherited,
         },
     )
 
@@ -235,77 +198,57 @@ def project_facts_with_callees(
 class TestListFunctionCalleesHappyPath:
     """Test happy path scenarios for list_function_callees."""
 
-    def test_function_with_no_callees(
-        self, test_path, project_facts_with_callees, base_contract_key
-    ):
-        """Test getting callees for a function with no callees."""
-        function_key = FunctionKey(
-            signature="initialize()",
-            contract_name="BaseContract",
-            path="contracts/Base.sol",
-        )
-        request = FunctionCalleesRequest(path=test_path, function_key=function_key)
-        response = list_function_callees(request, project_facts_with_callees)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.callees is not None
-        assert len(response.callees.internal_callees) == 0
-        assert len(response.callees.external_callees) == 0
-        assert len(response.callees.library_callees) == 0
-        assert response.callees.has_low_level_calls is False
-
-    def test_function_with_internal_callees(
-        self, test_path, project_facts_with_callees, child_contract_key
-    ):
-        """Test getting callees for a function with internal calls."""
-        function_key = FunctionKey(
-            signature="childFunction(address)",
-            contract_name="ChildContract",
-            path="contracts/Child.sol",
-        )
-        request = FunctionCalleesRequest(path=test_path, function_key=function_key)
-        response = list_function_callees(request, project_facts_with_callees)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.callees is not None
-        assert len(response.callees.internal_callees) == 1
-        assert "BaseContract.baseFunction()" in response.callees.internal_callees
-        assert len(response.callees.external_callees) == 0
-        assert len(response.callees.library_callees) == 0
-
-    def test_function_with_all_callee_types(
-        self, test_path, project_facts_with_callees, grandchild_contract_key
+    @pytest.mark.parametrize(
+        "signature,contract_name,path,expected",
+        [
+            pytest.param(
+                "initialize()",
+                "BaseContract",
+                "contracts/Base.sol",
+                {"internal": [], "external": [], "library": [], "low_level": False},
+                id="no_callees",
+            ),
+            pytest.param(
+                "childFunction(address)",
+                "ChildContract",
+                "contracts/Child.sol",
+                {
+                    "internal": ["BaseContract.baseFunction()"],
+                    "external": [],
+                    "library": [],
+                    "low_level": False,
+                },
+                id="internal_callees",
+            ),
+            pytest.param(
+                "grandchildFunction()",
+                "GrandchildContract",
+                "contracts/Grandchild.sol",
+                {
+                    "internal": ["BaseContract.baseFunction()", "BaseContract.initialize()"],
+                    "external": ["ChildContract.childFunction(address)"],
+                    "library": ["LibraryB.add(uint256,uint256)"],
+                    "low_level": True,
+                },
+                id="all_callee_types",
+            ),
+        ],
+    )
+    def test_function_callees(
+        self, test_path, project_facts_with_callees, signature, contract_name, path, expected
     ):
-        """Test getting callees for a function with internal, external, and library calls."""
-        function_key = FunctionKey(
-            signature="grandchildFunction()",
-            contract_name="GrandchildContract",
-            path="contracts/Grandchild.sol",
-        )
+        """Test getting callees for functions with no, internal, and mixed callee types."""
+        function_key = FunctionKey(signature=signature, contract_name=contract_name, path=path)
         request = FunctionCalleesRequest(path=test_path, function_key=function_key)
         response = list_function_callees(request, project_facts_with_callees)
 
         assert response.success is True
         assert response.error_message is None
         assert response.callees is not None
-
-        # Check internal callees
-        assert len(response.callees.internal_callees) == 2
-        assert "BaseContract.baseFunction()" in response.callees.internal_callees
-        assert "BaseContract.initialize()" in response.callees.internal_callees
-
-        # Check external callees
-        assert len(response.callees.external_callees) == 1
-        assert "ChildContract.childFunction(address)" in response.callees.external_callees
-
-        # Check library callees
-        assert len(response.callees.library_callees) == 1
-        assert "LibraryB.add(uint256,uint256)" in response.callees.library_callees
-
-        # Check low-level calls flag
-        assert response.callees.has_low_level_calls is True
+        assert sorted(response.callees.internal_callees) == sorted(expected["internal"])
+        assert sorted(response.callees.external_callees) == sorted(expected["external"])
+        assert sorted(response.callees.library_callees) == sorted(expected["library"])
+        assert response.callees.has_low_level_calls is expected["low_level"]
 
     def test_function_with_low_level_calls_only(self, test_path, project_facts):
         """Test function that only has low-level calls."""
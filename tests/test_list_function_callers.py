@@ -16,7 +16,19 @@ from slither_mcp.types import (
 )
 
 
-@pytest.fixture
+def _caller_keys(callers):
+    """Map each call type to the (contract_name, signature) pairs of its callers."""
+    return {
+        call_type: frozenset((c.contract_name, c.signature) for c in keys)
+        for call_type, keys in (
+            ("internal", callers.internal_callers),
+            ("external", callers.external_callers),
+            ("library", callers.library_callers),
+        )
+    }
+
+
+@pytest.fixture(scope="module")
 def callees_calling_base_function():
     """FunctionCallees that calls BaseContract.baseFunction()."""
     return FunctionCallees(
@@ -27,7 +39,7 @@ def callees_calling_base_function():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def callees_calling_child_function():
     """FunctionCallees that calls ChildContract.childFunction(address)."""
     return FunctionCallees(
@@ -38,7 +50,7 @@ def callees_calling_child_function():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def callees_calling_standalone_function():
     """FunctionCallees that calls StandaloneContract.standaloneFunction(uint256,address)."""
     return FunctionCallees(
@@ -49,7 +61,7 @@ def callees_calling_standalone_function():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def callees_calling_multiple_functions():
     """FunctionCallees that calls multiple functions."""
     return FunctionCallees(
@@ -60,12 +72,26 @@ def callees_calling_multiple_functions():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def complex_contract_key():
+    """Key for a contract with a complex function signature."""
+    return ContractKey(contract_name="ComplexContract", path="contracts/Complex.sol")
+
+
+@pytest.fixture(scope="module")
+def caller_contract_key():
+    """Key for a contract that calls the complex function."""
+    return ContractKey(contract_name="CallerContract", path="contracts/Caller.sol")
+
+
+@pytest.fixture(scope="module")
 def project_facts_with_callers(
     base_contract_key,
     child_contract_key,
     grandchild_contract_key,
     standalone_contract_key,
+    complex_contract_key,
+    caller_contract_key,
     callees_calling_base_function,
     callees_calling_child_function,
     callees_calling_standalone_function,
@@ -74,6 +100,47 @@ def project_facts_with_callers(
 ):
     """ProjectFacts with contracts that have various caller relationships."""
 
+    # Functions inherited by several contracts are built once and shared
+    initialize_fn = FunctionModel(
+        signature="initialize()",
+        implementation_contract=base_contract_key,
+        solidity_modifiers=["public"],
+        visibility="public",
+        function_modifiers=[],
+        arguments=[],
+        returns=[],
+        path="contracts/Base.sol",
+        line_start=10,
+        line_end=15,
+        callees=empty_callees,
+    )
+    base_function_fn = FunctionModel(
+        signature="baseFunction()",
+        implementation_contract=base_contract_key,
+        solidity_modifiers=["internal", "view"],
+        visibility="internal",
+        function_modifiers=[],
+        arguments=[],
+        returns=["uint256"],
+        path="contracts/Base.sol",
+        line_start=17,
+        line_end=20,
+        callees=empty_callees,
+    )
+    child_function_fn = FunctionModel(
+        signature="childFunction(address)",
+        implementation_contract=child_contract_key,
+        solidity_modifiers=["public", "payable"],
+        visibility="public",
+        function_modifiers=["onlyOwner"],
+        arguments=["address"],
+        returns=[],
+        path="contracts/Child.sol",
+        line_start=12,
+        line_end=18,
+        callees=callees_calling_base_function,
+    )
+
     # BaseContract with initialize() and baseFunction()
     base_contract = ContractModel(
         name="BaseContract",
@@ -86,32 +153,8 @@ def project_facts_with_callers(
         directly_inherits=[],
         scopes=[base_contract_key],
         functions_declared={
-            "initialize()": FunctionModel(
-                signature="initialize()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["public"],
-                visibility="public",
-                function_modifiers=[],
-                arguments=[],
-                returns=[],
-                path="contracts/Base.sol",
-                line_start=10,
-                line_end=15,
-                callees=empty_callees,  # No one calls anything
-            ),
-            "baseFunction()": FunctionModel(
-                signature="baseFunction()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["internal", "view"],
-                visibility="internal",
-                function_modifiers=[],
-                arguments=[],
-                returns=["uint256"],
-                path="contracts/Base.sol",
-                line_start=17,
-                line_end=20,
-                callees=empty_callees,  # No one calls anything
-            ),
+            "initialize()": initialize_fn,
+            "baseFunction()": base_function_fn,
         },
         functions_inherited={},
     )
@@ -128,47 +171,11 @@ def project_facts_with_callers(
         directly_inherits=[base_contract_key],
         scopes=[child_contract_key, base_contract_key],
         functions_declared={
-            "childFunction(address)": FunctionModel(
-                signature="childFunction(address)",
-                implementation_contract=child_contract_key,
-                solidity_modifiers=["public", "payable"],
-                visibility="public",
-                function_modifiers=["onlyOwner"],
-                arguments=["address"],
-                returns=[],
-                path="contracts/Child.sol",
-                line_start=12,
-                line_end=18,
-                callees=callees_calling_base_function,  # Calls baseFunction()
-            ),
+            "childFunction(address)": child_function_fn,
         },
         functions_inherited={
-            "initialize()": FunctionModel(
-                signature="initialize()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["public"],
-                visibility="public",
-                function_modifiers=[],
-                arguments=[],
-                returns=[],
-                path="contracts/Base.sol",
-                line_start=10,
-                line_end=15,
-                callees=empty_callees,
-            ),
-            "baseFunction()": FunctionModel(
-                signature="baseFunction()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["internal", "view"],
-                visibility="internal",
-                function_modifiers=[],
-                arguments=[],
-                returns=["uint256"],
-                path="contracts/Base.sol",
-                line_start=17,
-                line_end=20,
-                callees=empty_callees,
-            ),
+            "initialize()": initialize_fn,
+            "baseFunction()": base_function_fn,
         },
     )
 
@@ -212,45 +219,9 @@ def project_facts_with_callers(
             ),
         },
         functions_inherited={
-            "childFunction(address)": FunctionModel(
-                signature="childFunction(address)",
-                implementation_contract=child_contract_key,
-                solidity_modifiers=["public", "payable"],
-                visibility="public",
-                function_modifiers=["onlyOwner"],
-                arguments=["address"],
-                returns=[],
-                path="contracts/Child.sol",
-                line_start=12,
-                line_end=18,
-                callees=callees_calling_base_function,
-            ),
-            "initialize()": FunctionModel(
-                signature="initialize()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["public"],
-                visibility="public",
-                function_modifiers=[],
-                arguments=[],
-                returns=[],
-                path="contracts/Base.sol",
-                line_start=10,
-                line_end=15,
-                callees=empty_callees,
-            ),
-            "baseFunction()": FunctionModel(
-                signature="baseFunction()",
-                implementation_contract=base_contract_key,
-                solidity_modifiers=["internal", "view"],
-                visibility="internal",
-                function_modifiers=[],
-                arguments=[],
-                returns=["uint256"],
-                path="contracts/Base.sol",
-                line_start=17,
-                line_end=20,
-                callees=empty_callees,
-            ),
+            "childFunction(address)": child_function_fn,
+            "initialize()": initialize_fn,
+            "baseFunction()": base_function_fn,
         },
     )
 
@@ -296,133 +267,173 @@ def project_facts_with_callers(
         functions_inherited={},
     )
 
+    # ComplexContract with a function taking array and tuple arguments
+    complex_contract = ContractModel(
+        name="ComplexContract",
+        key=complex_contract_key,
+        path="contracts/Complex.sol",
+        is_abstract=False,
+        is_fully_implemented=True,
+        is_interface=False,
+        is_library=False,
+        directly_inherits=[],
+        scopes=[complex_contract_key],
+        functions_declared={
+            "complexFunction(uint256[],address,(uint256,bool))": FunctionModel(
+                signature="complexFunction(uint256[],address,(uint256,bool))",
+                implementation_contract=complex_contract_key,
+                solidity_modifiers=["external"],
+                visibility="external",
+                function_modifiers=[],
+                arguments=["uint256[]", "address", "(uint256,bool)"],
+                returns=[],
+                path="contracts/Complex.sol",
+                line_start=10,
+                line_end=15,
+                callees=empty_callees,
+            ),
+        },
+        functions_inherited={},
+    )
+
+    # CallerContract that calls complexFunction() externally
+    caller_contract = ContractModel(
+        name="CallerContract",
+        key=caller_contract_key,
+        path="contracts/Caller.sol",
+        is_abstract=False,
+        is_fully_implemented=True,
+        is_interface=False,
+        is_library=False,
+        directly_inherits=[],
+        scopes=[caller_contract_key, complex_contract_key],
+        functions_declared={
+            "callerFunction()": FunctionModel(
+                signature="callerFunction()",
+                implementation_contract=caller_contract_key,
+                solidity_modifiers=["public"],
+                visibility="public",
+                function_modifiers=[],
+                arguments=[],
+                returns=[],
+                path="contracts/Caller.sol",
+                line_start=10,
+                line_end=15,
+                callees=FunctionCallees(
+                    internal_callees=[],
+                    external_callees=[
+                        "ComplexContract.complexFunction(uint256[],address,(uint256,bool))"
+                    ],
+                    library_callees=[],
+                    has_low_level_calls=False,
+                ),
+            ),
+        },
+        functions_inherited={},
+    )
+
     return ProjectFacts(
         contracts={
             base_contract_key: base_contract,
             child_contract_key: child_contract,
             grandchild_contract_key: grandchild_contract,
             standalone_contract_key: standalone_contract,
+            complex_contract_key: complex_contract,
+            caller_contract_key: caller_contract,
         },
         project_dir="/test/project",
     )
 
 
-class TestListFunctionCallersHappyPath:
-    """Test happy path scenarios for list_function_callers."""
-
-    def test_function_with_no_callers(self, test_path, project_facts_with_callers):
-        """Test getting callers for a function with no callers."""
-        function_key = FunctionKey(
+# (function_key, expected_internal, expected_external, expected_library), where
+# each expected set holds (contract_name, signature) of the callers
+CALLER_CASES = [
+    pytest.param(
+        FunctionKey(
             signature="neverCalledFunction()",
             contract_name="StandaloneContract",
             path="contracts/Standalone.sol",
-        )
-        request = FunctionCallersRequest(path=test_path, function_key=function_key)
-        response = list_function_callers(request, project_facts_with_callers)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.callers is not None
-        assert len(response.callers.internal_callers) == 0
-        assert len(response.callers.external_callers) == 0
-        assert len(response.callers.library_callers) == 0
-
-    def test_function_with_single_internal_caller(self, test_path, project_facts_with_callers):
-        """Test getting callers for a function with internal callers."""
-        function_key = FunctionKey(
-            signature="baseFunction()",
-            contract_name="BaseContract",
-            path="contracts/Base.sol",
-        )
-        request = FunctionCallersRequest(path=test_path, function_key=function_key)
-        response = list_function_callers(request, project_facts_with_callers)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.callers is not None
-
-        # Should have 3 internal callers:
-        # 1. ChildContract.childFunction(address) (declared)
-        # 2. GrandchildContract.childFunction(address) (inherited, also calls it)
-        # 3. GrandchildContract.grandchildFunction() (declared)
-        assert len(response.callers.internal_callers) == 3
-
-        # Verify the callers
-        caller_sigs = {(c.contract_name, c.signature) for c in response.callers.internal_callers}
-        assert ("ChildContract", "childFunction(address)") in caller_sigs
-        assert ("GrandchildContract", "childFunction(address)") in caller_sigs
-        assert ("GrandchildContract", "grandchildFunction()") in caller_sigs
-
-        assert len(response.callers.external_callers) == 0
-        assert len(response.callers.library_callers) == 0
-
-    def test_function_with_external_callers(self, test_path, project_facts_with_callers):
-        """Test getting callers for a function with external callers."""
-        function_key = FunctionKey(
+        ),
+        set(),
+        set(),
+        set(),
+        id="no_callers",
+    ),
+    pytest.param(
+        FunctionKey(
+            signature="baseFunction()", contract_name="BaseContract", path="contracts/Base.sol"
+        ),
+        # childFunction(address) is declared in ChildContract and inherited by
+        # GrandchildContract, so both copies call baseFunction()
+        {
+            ("ChildContract", "childFunction(address)"),
+            ("GrandchildContract", "childFunction(address)"),
+            ("GrandchildContract", "grandchildFunction()"),
+        },
+        set(),
+        set(),
+        id="internal",
+    ),
+    pytest.param(
+        FunctionKey(
             signature="childFunction(address)",
             contract_name="ChildContract",
             path="contracts/Child.sol",
-        )
-        request = FunctionCallersRequest(path=test_path, function_key=function_key)
-        response = list_function_callers(request, project_facts_with_callers)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.callers is not None
-
-        # Should have 2 external callers from GrandchildContract
-        assert len(response.callers.external_callers) == 2
-
-        # Verify the callers
-        caller_sigs = {(c.contract_name, c.signature) for c in response.callers.external_callers}
-        assert ("GrandchildContract", "grandchildFunction()") in caller_sigs
-        assert ("GrandchildContract", "anotherFunction()") in caller_sigs
-
-        assert len(response.callers.internal_callers) == 0
-        assert len(response.callers.library_callers) == 0
-
-    def test_function_with_library_callers(self, test_path, project_facts_with_callers):
-        """Test getting callers for a function with library callers."""
-        function_key = FunctionKey(
+        ),
+        set(),
+        {
+            ("GrandchildContract", "grandchildFunction()"),
+            ("GrandchildContract", "anotherFunction()"),
+        },
+        set(),
+        id="external",
+    ),
+    pytest.param(
+        FunctionKey(
             signature="standaloneFunction(uint256,address)",
             contract_name="StandaloneContract",
             path="contracts/Standalone.sol",
-        )
-        request = FunctionCallersRequest(path=test_path, function_key=function_key)
-        response = list_function_callers(request, project_facts_with_callers)
-
-        assert response.success is True
-        assert response.error_message is None
-        assert response.callers is not None
+        ),
+        set(),
+        set(),
+        {("GrandchildContract", "grandchildFunction()")},
+        id="library",
+    ),
+]
 
-        # Should have 1 library caller from GrandchildContract.grandchildFunction()
-        assert len(response.callers.library_callers) == 1
 
-        caller = response.callers.library_callers[0]
-        assert caller.contract_name == "GrandchildContract"
-        assert caller.signature == "grandchildFunction()"
-
-        assert len(response.callers.internal_callers) == 0
-        assert len(response.callers.external_callers) == 0
+class TestListFunctionCallersHappyPath:
+    """Test happy path scenarios for list_function_callers."""
 
-    def test_function_with_multiple_caller_types(self, test_path, project_facts_with_callers):
-        """Test that callers are properly grouped by call type."""
-        # Test baseFunction which is called internally by multiple functions
-        function_key = FunctionKey(
-            signature="baseFunction()",
-            contract_name="BaseContract",
-            path="contracts/Base.sol",
-        )
+    @pytest.mark.parametrize(
+        "function_key,expected_internal,expected_external,expected_library", CALLER_CASES
+    )
+    def test_callers_by_call_type(
+        self,
+        test_path,
+        project_facts_with_callers,
+        function_key,
+        expected_internal,
+        expected_external,
+        expected_library,
+    ):
+        """Test that each caller is reported once, under the type of call it makes."""
         request = FunctionCallersRequest(path=test_path, function_key=function_key)
         response = list_function_callers(request, project_facts_with_callers)
 
         assert response.success is True
+        assert response.error_message is None
         assert response.callers is not None
 
-        # Should have internal callers but no external or library
-        assert len(response.callers.internal_callers) >= 1
-        assert len(response.callers.external_callers) == 0
-        assert len(response.callers.library_callers) == 0
+        assert _caller_keys(response.callers) == {
+            "internal": expected_internal,
+            "external": expected_external,
+            "library": expected_library,
+        }
+        # Each caller is listed once
+        assert len(response.callers.internal_callers) == len(expected_internal)
+        assert len(response.callers.external_callers) == len(expected_external)
+        assert len(response.callers.library_callers) == len(expected_library)
 
     def test_query_context_is_populated(self, test_path, project_facts_with_callers):
         """Test that query context is properly populated when include_query_context=True."""
@@ -537,101 +548,15 @@ class TestListFunctionCallersErrorCases:
 class TestListFunctionCallersEdgeCases:
     """Test edge cases for list_function_callers."""
 
-    def test_function_with_complex_signature(self, test_path, project_facts):
+    def test_function_with_complex_signature(self, test_path, project_facts_with_callers):
         """Test function with complex type signature."""
-        complex_contract_key = ContractKey(
-            contract_name="ComplexContract", path="contracts/Complex.sol"
-        )
-
-        caller_contract_key = ContractKey(
-            contract_name="CallerContract", path="contracts/Caller.sol"
-        )
-
-        # Create a complex function
-        complex_contract = ContractModel(
-            name="ComplexContract",
-            key=complex_contract_key,
-            path="contracts/Complex.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[],
-            scopes=[complex_contract_key],
-            functions_declared={
-                "complexFunction(uint256[],address,(uint256,bool))": FunctionModel(
-                    signature="complexFunction(uint256[],address,(uint256,bool))",
-                    implementation_contract=complex_contract_key,
-                    solidity_modifiers=["external"],
-                    visibility="external",
-                    function_modifiers=[],
-                    arguments=["uint256[]", "address", "(uint256,bool)"],
-                    returns=[],
-                    path="contracts/Complex.sol",
-                    line_start=10,
-                    line_end=15,
-                    callees=FunctionCallees(
-                        internal_callees=[],
-                        external_callees=[],
-                        library_callees=[],
-                        has_low_level_calls=False,
-                    ),
-                ),
-            },
-            functions_inherited={},
-        )
-
-        # Create a caller that calls the complex function
-        caller_contract = ContractModel(
-            name="CallerContract",
-            key=caller_contract_key,
-            path="contracts/Caller.sol",
-            is_abstract=False,
-            is_fully_implemented=True,
-            is_interface=False,
-            is_library=False,
-            directly_inherits=[],
-            scopes=[caller_contract_key, complex_contract_key],
-            functions_declared={
-                "callerFunction()": FunctionModel(
-                    signature="callerFunction()",
-                    implementation_contract=caller_contract_key,
-                    solidity_modifiers=["public"],
-                    visibility="public",
-                    function_modifiers=[],
-                    arguments=[],
-                    returns=[],
-                    path="contracts/Caller.sol",
-                    line_start=10,
-                    line_end=15,
-                    callees=FunctionCallees(
-                        internal_callees=[],
-                        external_callees=[
-                            "ComplexContract.complexFunction(uint256[],address,(uint256,bool))"
-                        ],
-                        library_callees=[],
-                        has_low_level_calls=False,
-                    ),
-                ),
-            },
-            functions_inherited={},
-        )
-
-        complex_facts = ProjectFacts(
-            contracts={
-                complex_contract_key: complex_contract,
-                caller_contract_key: caller_contract,
-            },
-            project_dir="/test/project",
-        )
-
         function_key = FunctionKey(
             signature="complexFunction(uint256[],address,(uint256,bool))",
             contract_name="ComplexContract",
             path="contracts/Complex.sol",
         )
         request = FunctionCallersRequest(path=test_path, function_key=function_key)
-        response = list_function_callers(request, complex_facts)
+        response = list_function_callers(request, project_facts_with_callers)
 
         assert response.success is True
         assert response.callers is not None
@@ -653,13 +578,9 @@ class TestListFunctionCallersEdgeCases:
         assert response.success is True
         assert response.callers is not None
 
-        # Count occurrences of each caller
-        internal_caller_keys = [
-            (c.contract_name, c.signature) for c in response.callers.internal_callers
-        ]
-
         # Each unique caller should appear only once
-        assert len(internal_caller_keys) == len(set(internal_caller_keys))
+        internal_callers = response.callers.internal_callers
+        assert len(internal_callers) == len(_caller_keys(response.callers)["internal"])
 
     def test_inherited_function_callers(self, test_path, project_facts_with_callers):
         """Test that callers work correctly with inherited functions."""
@@ -676,3 +597,60 @@ class TestListFunctionCallersEdgeCases:
         assert response.success is True
         assert response.callers is not None
         assert len(response.callers.external_callers) >= 1
+
+
+class TestCallersIndex:
+    """Tests for ProjectFacts.callers_index."""
+
+    def test_index_groups_callers_by_type(self, project_facts_with_callers):
+        """Test that every indexed caller appears once under its call type."""
+        index = project_facts_with_callers.callers_index
+        base_callers = index["BaseContract.baseFunction()"]
+
+        assert set(base_callers) == {"internal"}
+        assert len(base_callers["internal"]) == len(set(base_callers["internal"]))
+
+    def test_uncalled_function_is_absent(self, project_facts_with_callers):
+        """Test that functions nobody calls have no index entry."""
+        index = project_facts_with_callers.callers_index
+        assert "StandaloneContract.neverCalledFunction()" not in index
+
+    def test_qualified_types_share_an_entry(self, test_path, base_contract_key):
+        """Test that qualified and unqualified parameter types resolve to one entry."""
+        callees = FunctionCallees(
+            internal_callees=[],
+            external_callees=["Pool.swap(IPoolManager.SwapParams)"],
+            library_callees=[],
+            has_low_level_calls=False,
+        )
+        caller = FunctionModel(
+            signature="run()",
+            implementation_contract=base_contract_key,
+            solidity_modifiers=["external"],
+            visibility="external",
+            function_modifiers=[],
+            arguments=[],
+            returns=[],
+            path="contracts/Base.sol",
+            line_start=1,
+            line_end=2,
+            callees=callees,
+        )
+        contract = ContractModel(
+            name="BaseContract",
+            key=base_contract_key,
+            path="contracts/Base.sol",
+            is_abstract=False,
+            is_fully_implemented=True,
+            is_interface=False,
+            is_library=False,
+            directly_inherits=[],
+            scopes=[base_contract_key],
+            functions_declared={"run()": caller},
+            functions_inherited={},
+        )
+        facts = ProjectFacts(contracts={base_contract_key: contract}, project_dir="/test")
+
+        assert facts.callers_index["Pool.swap(SwapParams)"]["external"] == (
+            FunctionKey(signature="run()", contract_name="BaseContract", path="contracts/Base.sol"),
+        )
@@ -1,10 +1,99 @@
 """Tests for list_functions tool."""
 
+import sys
+from itertools import pairwise
+
+import pytest
+from pydantic import ValidationError
+
 from slither_mcp.tools.list_functions import (
+    FunctionInfo,
     ListFunctionsRequest,
     list_functions,
 )
-from slither_mcp.types import ContractKey
+from slither_mcp.types import ContractKey, ProjectFacts
+
+# Functions BaseContract declares, inherited by every contract derived from it
+_BASE_FUNCTIONS = frozenset({"initialize()", "baseFunction()"})
+
+
+def _signatures_of(functions):
+    """Return the signatures of the listed functions as a frozenset."""
+    return frozenset(func.function_key.signature for func in functions)
+
+
+def _partition(functions):
+    """Split listed functions into (all, declared, inherited) signature sets in one pass."""
+    signatures, declared, inherited = set(), set(), set()
+    for func in functions:
+        signature = func.function_key.signature
+        signatures.add(signature)
+        (declared if func.is_declared else inherited).add(signature)
+    return signatures, declared, inherited
+
+
+# (contract_key_fixture, visibility, has_modifiers, expected_signatures)
+FILTER_CASES = [
+    pytest.param(
+        "child_contract_key",
+        ["public"],
+        None,
+        {"childFunction(address)", "initialize()"},
+        id="public",
+    ),
+    pytest.param("child_contract_key", ["internal"], None, {"baseFunction()"}, id="internal"),
+    pytest.param(
+        "grandchild_contract_key", ["external"], None, {"grandchildFunction()"}, id="external"
+    ),
+    pytest.param(
+        "child_contract_key",
+        ["public", "internal"],
+        None,
+        {"childFunction(address)", "initialize()", "baseFunction()"},
+        id="public_or_internal",
+    ),
+    pytest.param("child_contract_key", None, ["payable"], {"childFunction(address)"}, id="payable"),
+    pytest.param(
+        "grandchild_contract_key",
+        None,
+        ["view"],
+        {"grandchildFunction()", "baseFunction()"},
+        id="view",
+    ),
+    pytest.param(
+        "multi_inherit_contract_key",
+        None,
+        ["external", "override"],
+        {"interfaceMethod()"},
+        id="external_or_override",
+    ),
+    pytest.param(
+        "child_contract_key",
+        ["public"],
+        ["payable"],
+        {"childFunction(address)"},
+        id="public_and_payable",
+    ),
+    # multiFunction is private, so only the inherited baseFunction is internal
+    pytest.param(
+        "multi_inherit_contract_key",
+        ["internal"],
+        None,
+        {"baseFunction()"},
+        id="internal_skips_private",
+    ),
+    pytest.param(
+        "multi_inherit_contract_key", ["private"], None, {"multiFunction()"}, id="private"
+    ),
+    # standaloneFunction has neither modifier
+    pytest.param("standalone_contract_key", None, ["view", "pure"], set(), id="no_match"),
+]
+
+
+@pytest.fixture(scope="session")
+def project_wide_full_response(test_path, project_facts):
+    """Unfiltered, unpaginated project-wide list_functions response."""
+    return list_functions(ListFunctionsRequest(path=test_path), project_facts)
 
 
 class TestListFunctionsHappyPath:
@@ -37,19 +126,14 @@ class TestListFunctionsHappyPath:
         assert response.total_count == 4  # 2 declared + 2 inherited
 
         # Check we have both declared and inherited functions
-        signatures = {f.function_key.signature for f in response.functions}
+        signatures, declared_signatures, inherited_signatures = _partition(response.functions)
         assert "childFunction(address)" in signatures
         assert "sendFunds(address,uint256)" in signatures  # New function added
-        assert "initialize()" in signatures
-        assert "baseFunction()" in signatures
+        assert _BASE_FUNCTIONS <= signatures
 
         # Verify is_declared flag
-        declared_funcs = [f for f in response.functions if f.is_declared]
-        inherited_funcs = [f for f in response.functions if not f.is_declared]
-
-        assert len(declared_funcs) == 2  # childFunction + sendFunds
-        assert len(inherited_funcs) == 2
-        declared_signatures = {f.function_key.signature for f in declared_funcs}
+        assert len(declared_signatures) == 2  # childFunction + sendFunds
+        assert len(inherited_signatures) == 2
         assert "childFunction(address)" in declared_signatures
         assert "sendFunds(address,uint256)" in declared_signatures
 
@@ -64,150 +148,57 @@ class TestListFunctionsHappyPath:
         assert response.error_message is None
         assert response.total_count == 4
 
-        signatures = {f.function_key.signature for f in response.functions}
+        signatures, declared, _ = _partition(response.functions)
         assert "grandchildFunction()" in signatures
         assert "childFunction(address)" in signatures
-        assert "initialize()" in signatures
-        assert "baseFunction()" in signatures
+        assert _BASE_FUNCTIONS <= signatures
 
         # Only grandchildFunction should be declared
-        declared = [f for f in response.functions if f.is_declared]
-        assert len(declared) == 1
-        assert declared[0].function_key.signature == "grandchildFunction()"
-
-    def test_filter_by_visibility_public(self, test_path, project_facts, child_contract_key):
-        """Test filtering functions by public visibility."""
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=child_contract_key, visibility=["public"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 2
-
-        signatures = {f.function_key.signature for f in response.functions}
-        assert "childFunction(address)" in signatures
-        assert "initialize()" in signatures
-        # baseFunction is internal, should not be included
-        assert "baseFunction()" not in signatures
-
-    def test_filter_by_visibility_internal(self, test_path, project_facts, child_contract_key):
-        """Test filtering functions by internal visibility."""
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=child_contract_key, visibility=["internal"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 1
-
-        func = response.functions[0]
-        assert func.function_key.signature == "baseFunction()"
-        assert func.visibility == "internal"
-
-    def test_filter_by_visibility_external(self, test_path, project_facts, grandchild_contract_key):
-        """Test filtering functions by external visibility."""
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=grandchild_contract_key, visibility=["external"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 1
-
-        func = response.functions[0]
-        assert func.function_key.signature == "grandchildFunction()"
-        assert func.visibility == "external"
-
-    def test_filter_by_multiple_visibilities(self, test_path, project_facts, child_contract_key):
-        """Test filtering by multiple visibility types."""
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=child_contract_key, visibility=["public", "internal"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 3  # All functions match
-
-    def test_filter_by_modifier(self, test_path, project_facts, child_contract_key):
-        """Test filtering functions by modifier."""
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=child_contract_key, has_modifiers=["payable"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 1
-
-        func = response.functions[0]
-        assert func.function_key.signature == "childFunction(address)"
-        assert "payable" in func.solidity_modifiers
-
-    def test_filter_by_view_modifier(self, test_path, project_facts, grandchild_contract_key):
-        """Test filtering functions by view modifier."""
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=grandchild_contract_key, has_modifiers=["view"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 2
-
-        signatures = {f.function_key.signature for f in response.functions}
-        assert "grandchildFunction()" in signatures
-        assert "baseFunction()" in signatures
-
-    def test_filter_by_multiple_modifiers(
-        self, test_path, project_facts, multi_inherit_contract_key
+        assert declared == {"grandchildFunction()"}
+
+    @pytest.mark.parametrize(
+        "contract_key_fixture,visibility,has_modifiers,expected_signatures", FILTER_CASES
+    )
+    def test_filter_functions(
+        self,
+        request,
+        test_path,
+        project_facts,
+        contract_key_fixture,
+        visibility,
+        has_modifiers,
+        expected_signatures,
     ):
-        """Test filtering by multiple modifiers."""
-        request = ListFunctionsRequest(
-            path=test_path,
-            contract_key=multi_inherit_contract_key,
-            has_modifiers=["external", "override"],
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        # Should find functions that have ANY of the specified modifiers
-        assert response.total_count >= 1
-
-        # interfaceMethod has both external and override
-        found_interface = any(
-            f.function_key.signature == "interfaceMethod()" for f in response.functions
-        )
-        assert found_interface is True
-
-    def test_filter_visibility_and_modifiers(self, test_path, project_facts, child_contract_key):
-        """Test filtering by both visibility and modifiers."""
-        request = ListFunctionsRequest(
+        """Test filtering a contract's functions by visibility and modifiers."""
+        list_request = ListFunctionsRequest(
             path=test_path,
-            contract_key=child_contract_key,
-            visibility=["public"],
-            has_modifiers=["payable"],
+            contract_key=request.getfixturevalue(contract_key_fixture),
+            visibility=visibility,
+            has_modifiers=has_modifiers,
         )
-        response = list_functions(request, project_facts)
+        response = list_functions(list_request, project_facts)
 
         assert response.success is True
-        assert response.total_count == 1
+        assert response.total_count == len(expected_signatures)
+        assert _signatures_of(response.functions) == expected_signatures
 
-        func = response.functions[0]
-        assert func.function_key.signature == "childFunction(address)"
-        assert func.visibility == "public"
-        assert "payable" in func.solidity_modifiers
+        wanted_modifiers = frozenset(has_modifiers or ())
+        for func in response.functions:
+            if visibility:
+                assert func.visibility in visibility
+            if has_modifiers:
+                # Functions match if they carry ANY of the requested modifiers
+                assert not wanted_modifiers.isdisjoint(func.solidity_modifiers)
 
     def test_function_info_completeness(self, test_path, project_facts, standalone_contract_key):
         """Test that FunctionInfo contains all required fields."""
         request = ListFunctionsRequest(path=test_path, contract_key=standalone_contract_key)
         response = list_functions(request, project_facts)
 
+        # Field types are enforced by the model; a JSON round trip checks that every
+        # field survives serialization to clients
         func = response.functions[0]
-        assert isinstance(func.function_key.signature, str)
-        assert isinstance(func.function_key.contract_name, str)
-        assert isinstance(func.function_key.path, str)
-        assert isinstance(func.visibility, str)
-        assert isinstance(func.solidity_modifiers, list)
-        assert isinstance(func.is_declared, bool)
+        assert FunctionInfo.model_validate_json(func.model_dump_json()) == func
 
 
 class TestListFunctionsErrorCases:
@@ -240,10 +231,9 @@ class TestListFunctionsErrorCases:
 class TestListFunctionsProjectWide:
     """Test project-wide listing (no contract_key)."""
 
-    def test_list_all_functions_project_wide(self, test_path, project_facts):
+    def test_list_all_functions_project_wide(self, project_wide_full_response):
         """Test listing all functions across all contracts."""
-        request = ListFunctionsRequest(path=test_path)  # No contract_key
-        response = list_functions(request, project_facts)
+        response = project_wide_full_response  # No contract_key
 
         assert response.success is True
         assert response.error_message is None
@@ -264,9 +254,8 @@ class TestListFunctionsProjectWide:
         assert response.success is True
 
         # Verify no functions from excluded paths
-        for func in response.functions:
-            assert not func.function_key.path.startswith("lib/")
-            assert not func.function_key.path.startswith("test/")
+        excluded = ("lib/", "test/")
+        assert not any(f.function_key.path.startswith(excluded) for f in response.functions)
 
     def test_list_functions_project_wide_with_visibility_filter(self, test_path, project_facts):
         """Test project-wide listing with visibility filter."""
@@ -279,12 +268,11 @@ class TestListFunctionsProjectWide:
         for func in response.functions:
             assert func.visibility == "external"
 
-    def test_list_functions_project_wide_pagination(self, test_path, project_facts):
+    def test_list_functions_project_wide_pagination(
+        self, test_path, project_facts, project_wide_full_response
+    ):
         """Test pagination across multiple contracts."""
-        # First get total count
-        full_request = ListFunctionsRequest(path=test_path)
-        full_response = list_functions(full_request, project_facts)
-        total = full_response.total_count
+        total = project_wide_full_response.total_count
 
         # Now paginate
         request = ListFunctionsRequest(path=test_path, limit=3, offset=0)
@@ -303,9 +291,9 @@ class TestListFunctionsProjectWide:
 
         assert response.success is True
 
-        # Verify sorting
+        # Verify sorting: each signature sorts no later than the next one
         signatures = [f.function_key.signature.lower() for f in response.functions]
-        assert signatures == sorted(signatures)
+        assert all(a <= b for a, b in pairwise(signatures))
 
     def test_list_functions_project_wide_empty_project(self, test_path, empty_project_facts):
         """Test project-wide listing with empty project."""
@@ -317,6 +305,73 @@ class TestListFunctionsProjectWide:
         assert len(response.functions) == 0
 
 
+class TestListFunctionsCaching:
+    """Tests for reuse of filtered listings across requests."""
+
+    def test_pages_share_one_listing(self, test_path, project_facts):
+        """Test that every page of a listing is sliced from one cached result."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        first = list_functions(ListFunctionsRequest(path=test_path, sort_by="name", limit=3), facts)
+        second = list_functions(
+            ListFunctionsRequest(path=test_path, sort_by="name", offset=3, limit=3), facts
+        )
+
+        (cached,) = facts.query_cache.values()
+        assert first.functions + second.functions == cached[:6]
+        assert first.total_count == second.total_count == len(cached)
+
+    def test_filters_are_part_of_the_key(self, test_path, project_facts, child_contract_key):
+        """Test that requests with different filters are cached separately."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        public = list_functions(
+            ListFunctionsRequest(
+                path=test_path, contract_key=child_contract_key, visibility=["public"]
+            ),
+            facts,
+        )
+        internal = list_functions(
+            ListFunctionsRequest(
+                path=test_path, contract_key=child_contract_key, visibility=["internal"]
+            ),
+            facts,
+        )
+
+        assert _signatures_of(public.functions) == {"childFunction(address)", "initialize()"}
+        assert _signatures_of(internal.functions) == {"baseFunction()"}
+        assert len(facts.query_cache) == 2
+
+    def test_cache_hit_skips_contract_selection(self, monkeypatch, test_path, project_facts):
+        """Test that a cached listing is served without filtering the contracts again."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        request = ListFunctionsRequest(path=test_path, exclude_paths=["lib/"])
+        first = list_functions(request, facts)
+
+        def fail(*args):
+            raise AssertionError("contracts were filtered on a cache hit")
+
+        tool_module = sys.modules[list_functions.__module__]
+        monkeypatch.setattr(tool_module, "path_matches_exclusion", fail)
+        assert list_functions(request, facts).functions == first.functions
+
+    def test_listings_are_evicted_past_the_cache_size(self, monkeypatch, test_path, project_facts):
+        """Test that varying the filters keeps at most QUERY_CACHE_MAXSIZE listings."""
+        monkeypatch.setattr("slither_mcp.types.QUERY_CACHE_MAXSIZE", 2)
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        for visibility in ("public", "external", "internal"):
+            list_functions(ListFunctionsRequest(path=test_path, visibility=[visibility]), facts)
+
+        assert [key[2] for key in facts.query_cache] == [("external",), ("internal",)]
+
+    def test_cached_functions_cannot_be_modified(self, test_path, project_facts):
+        """Test that callers cannot change the function infos shared through the cache."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/cached")
+        func = list_functions(ListFunctionsRequest(path=test_path), facts).functions[0]
+
+        with pytest.raises(ValidationError):
+            func.visibility = "private"
+        assert isinstance(func.solidity_modifiers, tuple)
+
+
 class TestListFunctionsEdgeCases:
     """Test edge cases for list_functions."""
 
@@ -330,34 +385,6 @@ class TestListFunctionsEdgeCases:
         assert response.total_count == 0
         assert len(response.functions) == 0
 
-    def test_filter_no_matches_visibility(
-        self, test_path, project_facts, multi_inherit_contract_key
-    ):
-        """Test filtering that matches no functions."""
-        # multiFunction is private, but we filter for internal
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=multi_inherit_contract_key, visibility=["internal"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        # Should only get baseFunction which is internal
-        assert response.total_count == 1
-        assert response.functions[0].function_key.signature == "baseFunction()"
-
-    def test_filter_no_matches_modifiers(self, test_path, project_facts, standalone_contract_key):
-        """Test filtering by modifier that doesn't exist."""
-        request = ListFunctionsRequest(
-            path=test_path,
-            contract_key=standalone_contract_key,
-            has_modifiers=["view", "pure"],  # standaloneFunction has neither
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 0
-        assert len(response.functions) == 0
-
     def test_interface_functions(self, test_path, project_facts, interface_a_key):
         """Test listing functions in an interface."""
         request = ListFunctionsRequest(path=test_path, contract_key=interface_a_key)
@@ -382,22 +409,6 @@ class TestListFunctionsEdgeCases:
         assert func.function_key.signature == "add(uint256,uint256)"
         assert "pure" in func.solidity_modifiers
 
-    def test_private_function_visibility(
-        self, test_path, project_facts, multi_inherit_contract_key
-    ):
-        """Test that private functions are included in listings."""
-        request = ListFunctionsRequest(
-            path=test_path, contract_key=multi_inherit_contract_key, visibility=["private"]
-        )
-        response = list_functions(request, project_facts)
-
-        assert response.success is True
-        assert response.total_count == 1
-
-        func = response.functions[0]
-        assert func.function_key.signature == "multiFunction()"
-        assert func.visibility == "private"
-
     def test_multiple_inheritance(self, test_path, project_facts, multi_inherit_contract_key):
         """Test listing functions from contract with multiple inheritance."""
         request = ListFunctionsRequest(path=test_path, contract_key=multi_inherit_contract_key)
@@ -408,8 +419,7 @@ class TestListFunctionsEdgeCases:
         # initialize (inherited from Base), baseFunction (inherited from Base)
         assert response.total_count == 4
 
-        declared = [f for f in response.functions if f.is_declared]
-        inherited = [f for f in response.functions if not f.is_declared]
+        _, declared, inherited = _partition(response.functions)
 
         assert len(declared) == 2
         assert len(inherited) == 2
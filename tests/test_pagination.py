@@ -129,6 +129,15 @@ class TestApplyPagination:
         assert total == 5
         assert has_more is False
 
+    def test_tuple_pages_stay_tuples(self):
+        """Test that paginating a tuple returns a tuple slice."""
+        items = ("a", "b", "c", "d", "e")
+        result, total, has_more = apply_pagination(items, offset=1, limit=2)
+
+        assert result == ("b", "c")
+        assert total == 5
+        assert has_more is True
+
     def test_empty_list(self):
         """Test pagination on empty list."""
         items: list[str] = []
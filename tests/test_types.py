@@ -1,6 +1,13 @@
 """Tests for types.py functions."""
 
+import pytest
+
 from slither_mcp.types import (
+    ContractKey,
+    ContractModel,
+    FunctionCallees,
+    ProjectFacts,
+    QueryCache,
     find_matching_signature,
     normalize_signature,
     path_matches_exclusion,
@@ -164,3 +171,354 @@ class TestPathMatchesExclusion:
     def test_empty_patterns(self):
         """Test with empty patterns list."""
         assert path_matches_exclusion("any/path.sol", []) is False
+
+
+class TestDerivedContractsMap:
+    """Tests for ProjectFacts.derived_contracts_map."""
+
+    def test_maps_parents_to_direct_children(
+        self,
+        project_facts,
+        base_contract_key,
+        child_contract_key,
+        grandchild_contract_key,
+        multi_inherit_contract_key,
+        interface_a_key,
+    ):
+        """Test that each parent maps to its direct children in contract order."""
+        derived = project_facts.derived_contracts_map
+        assert derived[base_contract_key] == (child_contract_key, multi_inherit_contract_key)
+        assert derived[child_contract_key] == (grandchild_contract_key,)
+        assert derived[interface_a_key] == (multi_inherit_contract_key,)
+
+    def test_leaf_contracts_absent(self, project_facts, standalone_contract_key):
+        """Test that contracts nothing inherits from have no entry."""
+        assert standalone_contract_key not in project_facts.derived_contracts_map
+
+    def test_computed_once(self, project_facts):
+        """Test that the map is cached on the ProjectFacts instance."""
+        assert project_facts.derived_contracts_map is project_facts.derived_contracts_map
+
+    def test_not_serialized(self, project_facts):
+        """Test that the cached map is not written into the serialized facts."""
+        assert "derived_contracts_map" not in project_facts.model_dump(mode="json")
+
+
+class TestProjectFactsConstruction:
+    """Tests for building ProjectFacts from existing contract models."""
+
+    def test_contract_models_are_not_modified(self, project_facts, child_contract_key):
+        """Test that building ProjectFacts leaves the given contract models untouched."""
+        loaded = ProjectFacts.model_validate(project_facts.model_dump(mode="json"))
+        child = loaded.contracts[child_contract_key]
+        key, parents, scopes = child.key, child.directly_inherits, child.scopes
+
+        ProjectFacts(contracts=loaded.contracts, project_dir="/test/rebuilt")
+
+        assert child.key is key
+        assert child.directly_inherits is parents
+        assert child.scopes is scopes
+
+    def test_missing_parents_are_kept(self, orphan_project_facts, orphan_key, missing_parent_key):
+        """Test that references to contracts outside the facts survive a round trip."""
+        loaded = ProjectFacts.model_validate(orphan_project_facts.model_dump(mode="json"))
+        assert loaded.contracts[orphan_key].directly_inherits == (missing_parent_key,)
+
+
+class TestCopiesDropCachedProperties:
+    """Tests for CachedPropertyModel copies."""
+
+    def test_project_facts_copy_recomputes_derived_data(self, project_facts):
+        """Test that a copied ProjectFacts does not serve the original's caches."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/copy")
+        facts.query_cache[("probe",)] = "stale"
+        assert facts.contract_keys_by_name
+
+        copied = facts.model_copy(update={"contracts": {}})
+
+        assert copied.query_cache == {}
+        assert copied.contract_keys_by_name == {}
+        # The original keeps its own caches
+        assert facts.query_cache == {("probe",): "stale"}
+
+    def test_deep_copy_recomputes_derived_data(self, project_facts):
+        """Test that deep copies drop cached values as well."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/copy")
+        facts.query_cache[("probe",)] = "stale"
+
+        assert facts.model_copy(deep=True).query_cache == {}
+
+    def test_contract_model_copy_recomputes_signatures(self, base_contract):
+        """Test that a copied ContractModel rebuilds its normalized signature map."""
+        contract = base_contract.model_copy()
+        assert "initialize()" in contract.normalized_signatures
+
+        copied = contract.model_copy(update={"functions_declared": {}, "functions_inherited": {}})
+
+        assert copied.normalized_signatures == {}
+        assert not copied.does_contract_contain_function("initialize()")
+
+
+class TestFindFunctionSignature:
+    """Tests for ContractModel.find_function_signature and does_contract_contain_function."""
+
+    @pytest.fixture
+    def qualified_contract(self, base_contract):
+        """Contract storing signatures with qualified parameter types."""
+        function = base_contract.functions_declared["initialize()"]
+        # Built fresh so no cached signature map carries over from the shared fixture
+        return ContractModel(
+            name="Pool",
+            key=ContractKey(contract_name="Pool", path="contracts/Pool.sol"),
+            path="contracts/Pool.sol",
+            is_abstract=False,
+            is_fully_implemented=True,
+            is_interface=False,
+            is_library=False,
+            directly_inherits=[],
+            scopes=[],
+            functions_declared={"swap(IPoolManager.SwapParams)": function},
+            functions_inherited={
+                "swap(Other.SwapParams)": function,
+                "settle(Currency.Id)": function,
+            },
+        )
+
+    def test_exact_match(self, qualified_contract):
+        """Test that a stored signature is returned as-is."""
+        assert (
+            qualified_contract.find_function_signature("settle(Currency.Id)")
+            == "settle(Currency.Id)"
+        )
+
+    def test_normalized_match_prefers_declared(self, qualified_contract):
+        """Test that declared functions win when several signatures normalize alike."""
+        assert (
+            qualified_contract.find_function_signature("swap(SwapParams)")
+            == "swap(IPoolManager.SwapParams)"
+        )
+        assert qualified_contract.find_function_signature("settle(Id)") == "settle(Currency.Id)"
+
+    def test_no_match(self, qualified_contract):
+        """Test that unknown signatures return None."""
+        assert qualified_contract.find_function_signature("missing()") is None
+
+    def test_contains_function_uses_normalized_match(self, qualified_contract):
+        """Test that does_contract_contain_function matches the same signatures."""
+        assert qualified_contract.does_contract_contain_function("swap(SwapParams)")
+        assert qualified_contract.does_contract_contain_function("settle(Id)")
+        assert not qualified_contract.does_contract_contain_function("missing()")
+
+    def test_normalized_signatures_not_serialized(self, qualified_contract):
+        """Test that the cached signature map is not written into the model."""
+        assert qualified_contract.normalized_signatures
+        assert "normalized_signatures" not in qualified_contract.model_dump(mode="json")
+
+
+class TestInternCallees:
+    """Tests for FunctionCallees.intern_callees."""
+
+    def test_equal_callees_share_strings(self):
+        """Test that equal callee strings built separately become one object."""
+
+        def build():
+            # Built at runtime, as facts.py does from Slither objects
+            callee = "".join(["Base.", "foo(uint256)"])
+            return FunctionCallees(
+                internal_callees=[callee],
+                external_callees=[],
+                library_callees=[],
+                has_low_level_calls=False,
+            )
+
+        first, second = build(), build()
+
+        assert first.internal_callees == ["Base.foo(uint256)"]
+        assert first.internal_callees[0] is second.internal_callees[0]
+
+
+class TestQueryCache:
+    """Tests for ProjectFacts.query_cache."""
+
+    def test_starts_empty_per_instance(self, project_facts):
+        """Test that each ProjectFacts gets its own cache."""
+        other = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/other")
+        assert other.query_cache == {}
+        assert other.query_cache is not project_facts.query_cache
+
+    def test_not_serialized(self, project_facts):
+        """Test that cached query results are not written into the serialized facts."""
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/other")
+        facts.query_cache[("tool", "arg")] = "result"
+        assert "query_cache" not in facts.model_dump(mode="json")
+
+
+class TestQueryCacheBounds:
+    """Tests for QueryCache eviction."""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test that storing past the cap drops the entry used least recently."""
+        cache = QueryCache(maxsize=2)
+        cache[("tool", 1)] = "one"
+        cache[("tool", 2)] = "two"
+        # Reading an entry makes it the most recently used
+        assert cache.get(("tool", 1)) == "one"
+        cache[("tool", 3)] = "three"
+
+        assert list(cache) == [("tool", 1), ("tool", 3)]
+        assert cache.get(("tool", 2)) is None
+
+    def test_caps_each_tool_separately(self):
+        """Test that one tool's entries never evict another tool's."""
+        cache = QueryCache(maxsize=1)
+        cache[("other_tool",)] = "kept"
+        for arg in range(5):
+            cache[("tool", arg)] = arg
+
+        assert len(cache) == 2
+        assert cache[("other_tool",)] == "kept"
+        assert cache[("tool", 4)] == 4
+
+    def test_project_facts_use_configured_size(self, monkeypatch, project_facts):
+        """Test that ProjectFacts builds its cache with QUERY_CACHE_MAXSIZE."""
+        monkeypatch.setattr("slither_mcp.types.QUERY_CACHE_MAXSIZE", 3)
+        facts = ProjectFacts(contracts=project_facts.contracts, project_dir="/test/bounded")
+        assert facts.query_cache.maxsize == 3
+
+
+class TestLinearizedInheritance:
+    """Tests for ProjectFacts.linearized_inheritance."""
+
+    def test_chain_orders_parents_first(
+        self, project_facts, base_contract_key, child_contract_key, grandchild_contract_key
+    ):
+        """Test that a single inheritance chain ends with the contract itself."""
+        assert project_facts.linearized_inheritance[grandchild_contract_key] == (
+            base_contract_key,
+            child_contract_key,
+            grandchild_contract_key,
+        )
+
+    def test_multiple_inheritance_is_left_to_right(
+        self, project_facts, base_contract_key, interface_a_key, multi_inherit_contract_key
+    ):
+        """Test that the leftmost parent comes first."""
+        assert project_facts.linearized_inheritance[multi_inherit_contract_key] == (
+            base_contract_key,
+            interface_a_key,
+            multi_inherit_contract_key,
+        )
+
+    def test_missing_parent_skipped(self, orphan_project_facts, orphan_key):
+        """Test that parents absent from the facts are left out."""
+        assert orphan_project_facts.linearized_inheritance[orphan_key] == (orphan_key,)
+
+    def test_cyclic_contracts_absent(self, circular_project_facts):
+        """Test that contracts on an inheritance cycle have no order."""
+        assert circular_project_facts.linearized_inheritance == {}
+
+
+class TestCyclicInheritance:
+    """Tests for ProjectFacts.cyclic_inheritance."""
+
+    def test_acyclic_project_is_empty(self, project_facts):
+        """Test that a valid inheritance graph has no cyclic contracts."""
+        assert project_facts.cyclic_inheritance == frozenset()
+
+    def test_circular_pair(self, circular_project_facts, circular_a_key, circular_b_key):
+        """Test that both contracts of a two-contract cycle are reported."""
+        assert circular_project_facts.cyclic_inheritance == {circular_a_key, circular_b_key}
+
+    def test_self_reference(self, self_ref_project_facts, self_ref_key):
+        """Test that a contract inheriting from itself is reported."""
+        assert self_ref_project_facts.cyclic_inheritance == {self_ref_key}
+
+    def test_missing_parent_is_not_a_cycle(self, orphan_project_facts):
+        """Test that a parent missing from the facts is treated as a leaf."""
+        assert orphan_project_facts.cyclic_inheritance == frozenset()
+
+    def test_descendant_of_cycle_is_reported(
+        self, circular_project_facts, circular_a_key, circular_b_key
+    ):
+        """Test that a contract inheriting from a cycle is reported along with it."""
+        child_key = ContractKey(contract_name="Child", path="contracts/Child.sol")
+        child = ContractModel(
+            name="Child",
+            key=child_key,
+            path="contracts/Child.sol",
+            is_abstract=False,
+            is_fully_implemented=True,
+            is_interface=False,
+            is_library=False,
+            directly_inherits=[circular_a_key],
+            scopes=[child_key, circular_a_key],
+            functions_declared={},
+            functions_inherited={},
+        )
+        facts = ProjectFacts(
+            contracts={**circular_project_facts.contracts, child_key: child},
+            project_dir="/test/circular",
+        )
+        assert facts.cyclic_inheritance == {circular_a_key, circular_b_key, child_key}
+
+
+class TestContractsByKind:
+    """Tests for ProjectFacts.contracts_by_kind."""
+
+    def test_kinds(
+        self,
+        project_facts,
+        base_contract_key,
+        interface_a_key,
+        library_b_key,
+        child_contract_key,
+        grandchild_contract_key,
+        multi_inherit_contract_key,
+        standalone_contract_key,
+        empty_contract_key,
+    ):
+        """Test that each kind lists its contracts in contract order."""
+        assert project_facts.contracts_by_kind == {
+            "concrete": (
+                child_contract_key,
+                grandchild_contract_key,
+                multi_inherit_contract_key,
+                standalone_contract_key,
+                empty_contract_key,
+            ),
+            "interface": (interface_a_key,),
+            "library": (library_b_key,),
+            "abstract": (base_contract_key,),
+        }
+
+    def test_empty_project(self, empty_project_facts):
+        """Test that every kind is present even when there are no contracts."""
+        assert empty_project_facts.contracts_by_kind == {
+            "concrete": (),
+            "interface": (),
+            "library": (),
+            "abstract": (),
+        }
+
+
+class TestContractKeysByName:
+    """Tests for ProjectFacts.contract_keys_by_name."""
+
+    def test_keys_by_name(self, project_facts, base_contract_key, child_contract_key):
+        """Test that each contract name maps to its key."""
+        index = project_facts.contract_keys_by_name
+        assert index["BaseContract"] == (base_contract_key,)
+        assert index["ChildContract"] == (child_contract_key,)
+        assert len(index) == len(project_facts.contracts)
+
+    def test_same_name_in_several_files(self, project_facts, base_contract):
+        """Test that contracts sharing a name are all listed, in contract order."""
+        other_key = ContractKey(contract_name="BaseContract", path="contracts/other/Base.sol")
+        contracts = dict(project_facts.contracts)
+        contracts[other_key] = base_contract
+        facts = ProjectFacts(contracts=contracts, project_dir="/test/duplicates")
+
+        assert facts.contract_keys_by_name["BaseContract"] == (
+            ContractKey(contract_name="BaseContract", path="contracts/Base.sol"),
+            other_key,
+        )